@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import argparse
+
+import puzzles
+
+def solve_batch(day: int, part: int, inputs: list, **params) -> list:
+    ''' Answers for many inputs of one day, in order
+
+        All inputs are solved in this process, so input-independent work kept in
+        module-level caches (day 11 stone counts, day 21 keypad costs and code
+        complexities) is computed once for the whole batch.
+    '''
+    return [puzzles.solve(day, part, input, **params) for input in inputs]
+
+def solve_files(day: int, part: int, filenames: list[str], **params) -> list:
+    return solve_batch(day, part, [puzzles.load_input(day, filename) for filename in filenames], **params)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = "Solve one day's part for many input files")
+    parser.add_argument("day", type = int)
+    parser.add_argument("part", type = int)
+    parser.add_argument("filenames", nargs = "+")
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    for filename, answer in zip(args.filenames, solve_files(args.day, args.part, args.filenames)):
+        print(f"{filename}: {answer}")
+
+if __name__ == "__main__":
+    main()
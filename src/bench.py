@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import puzzles
+
+BASELINE = "bench_baseline.json"
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q * len(ordered)))
+
+    return ordered[rank - 1]
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "runs": len(samples),
+    }
+
+def time_warm(day: int, part: int, runs: int) -> list[float]:
+    ''' Caches are cleared before every run, or days 11 and 21 would time cache hits '''
+    input = puzzles.load_input(day)
+    puzzles.solve(day, part, input)
+
+    samples = []
+    for _ in range(runs):
+        puzzles.clear_caches(day)
+        start = time.perf_counter()
+        puzzles.solve(day, part, input)
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+def time_cold(day: int, part: int, runs: int) -> list[float]:
+    ''' Every cold run pays for a fresh interpreter, the imports and reading the input '''
+    command = [sys.executable, os.path.abspath(__file__), "--child", str(day), str(part)]
+
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check = True, stdout = subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+def run_child(day: int, part: int):
+    answer = puzzles.solve(day, part, puzzles.load_input(day))
+    assert answer == puzzles.answer(day, part)
+
+def benchmark(days: list[int], warm_runs: int, cold_runs: int) -> dict[str, dict]:
+    results = {}
+    for day in days:
+        for part in range(1, len(puzzles.PUZZLES[day].parts) + 1):
+            key = f"{day:02d}.{part}"
+            results[key] = {}
+            if warm_runs:
+                results[key]["warm"] = summarize(time_warm(day, part, warm_runs))
+            if cold_runs:
+                results[key]["cold"] = summarize(time_cold(day, part, cold_runs))
+
+            print(key, " ".join(
+                f"{mode}: median {stats['median'] * 1000:.1f} ms, p95 {stats['p95'] * 1000:.1f} ms"
+                for mode, stats in results[key].items()
+            ), flush = True)
+
+    return results
+
+def find_regressions(results: dict[str, dict], baseline: dict[str, dict], threshold: float) -> list[str]:
+    regressions = []
+    for key, modes in results.items():
+        for mode, stats in modes.items():
+            if (previous := baseline.get(key, {}).get(mode)) is None:
+                continue
+
+            if stats["median"] > previous["median"] * (1 + threshold):
+                regressions.append(
+                    f"{key} {mode}: median {stats['median'] * 1000:.1f} ms "
+                    f"vs baseline {previous['median'] * 1000:.1f} ms"
+                )
+
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = "Benchmark every solve_part_N against the stored baseline")
+    parser.add_argument("days", nargs = "*", type = int, default = sorted(puzzles.PUZZLES))
+    parser.add_argument("--warm", type = int, default = 5, help = "timed in-process runs after one warm-up run")
+    parser.add_argument("--cold", type = int, default = 3, help = "runs in a fresh interpreter each")
+    parser.add_argument("--threshold", type = float, default = 0.2, help = "allowed median slowdown, 0.2 = 20%%")
+    parser.add_argument("--baseline", default = BASELINE)
+    parser.add_argument("--save", action = "store_true", help = "store the results as the new baseline")
+    parser.add_argument("--child", nargs = 2, type = int, help = argparse.SUPPRESS)
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    results = benchmark(args.days, args.warm, args.cold)
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as file:
+                baseline = json.load(file)
+        baseline.update(results)
+
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent = 2, sort_keys = True)
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save first")
+        return
+
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
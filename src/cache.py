@@ -0,0 +1,122 @@
+import os
+import sys
+import time
+import types
+from collections.abc import Callable
+
+import loader
+
+CACHE_DIR = ".cache"
+
+# `hashlib`, `json` and `pickle` are imported where used: between them they pull
+# in `re` and `enum`, which a day module importing this one would pay for on
+# every start even when no cache is ever touched
+
+def file_digest(filename: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(loader.Input(filename).buffer).hexdigest()
+
+def source_digest(module_name: str) -> str:
+    import hashlib
+
+    with open(sys.modules[module_name].__file__, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+def parsed(filename: str, parse: Callable[[str], object]):
+    ''' Parsed input keyed by the SHA-256 of the input file
+
+        The parser's module source is part of the key as well, so editing the parser
+        invalidates its entries just like editing the input does.
+    '''
+    import pickle
+
+    key = "-".join([
+        parse.__module__,
+        parse.__qualname__,
+        source_digest(parse.__module__)[:16],
+        file_digest(filename),
+    ])
+    path = os.path.join(CACHE_DIR, "parsed", f"{key}.pickle")
+
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    value = parse(filename)
+
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    with open(f"{path}.tmp", "wb") as file:
+        pickle.dump(value, file, protocol = pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{path}.tmp", path)
+
+    return value
+
+ANSWERS = os.path.join(CACHE_DIR, "answers.json")
+MAX_ANSWERS = 1024
+
+def module_digest(module) -> str:
+    ''' Source of the module and of the repo modules it uses, e.g. `grid` or `loader` '''
+    import hashlib
+
+    directory = os.path.dirname(module.__file__)
+
+    files = {module.__file__}
+    for value in vars(module).values():
+        used = value if isinstance(value, types.ModuleType) else sys.modules.get(getattr(value, "__module__", None))
+        filename = getattr(used, "__file__", None)
+        if filename and os.path.dirname(filename) == directory:
+            files.add(filename)
+
+    digest = hashlib.sha256()
+    for filename in sorted(files):
+        with open(filename, "rb") as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+class AnswerCache:
+    ''' Answers keyed by day, part, input SHA and solver source, least recently used evicted first '''
+    def __init__(self, filename: str = ANSWERS, capacity: int = MAX_ANSWERS):
+        self.filename = filename
+        self.capacity = capacity
+        self.entries = {}
+
+        if os.path.exists(filename):
+            import json
+
+            with open(filename, "r", encoding="utf-8") as file:
+                self.entries = json.load(file)
+
+    def key(self, day: int, part: int, module, input_filename: str, registry) -> str:
+        ''' `registry` is the module calling the solver, the arguments it passes
+            (day 21's `depth`, day 14's `w` and `h`) decide the answer as well
+        '''
+        return "-".join([
+            f"{day:02d}.{part}",
+            file_digest(input_filename),
+            module_digest(module),
+            source_digest(registry.__name__)[:16],
+        ])
+
+    def get(self, key: str):
+        if (entry := self.entries.get(key)) is None:
+            return None
+
+        entry["used"] = time.time()
+
+        return entry["answer"]
+
+    def put(self, key: str, answer):
+        self.entries[key] = {"answer": answer, "used": time.time()}
+
+    def save(self):
+        import json
+
+        recent = sorted(self.entries.items(), key = lambda item: item[1]["used"], reverse = True)
+        self.entries = dict(recent[:self.capacity])
+
+        os.makedirs(os.path.dirname(self.filename), exist_ok = True)
+        with open(f"{self.filename}.tmp", "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, indent = 2)
+        os.replace(f"{self.filename}.tmp", self.filename)
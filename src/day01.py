@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 
+import array
 import collections
+import heapq
+import itertools
+import os
+import sys
+from collections.abc import Iterable, Iterator
+
+import lazy
+import loader
+
+ANSWERS = (3_569_916, 26_407_426)
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
 
 def build_pairs(input: list[str]) -> list[tuple[int, int]]:
     values = [line.split(" ") for line in input]
@@ -26,7 +36,172 @@ def solve_part_2(input: list[str]):
 
     return similarity
 
-def check():
+def read_columns(filename: str):
+    ''' Both lists as int64 arrays, parsed by numpy without any Python objects per line '''
+    import numpy
+
+    values = numpy.fromfile(filename, dtype = numpy.int64, sep = " ")
+
+    return values[0::2], values[1::2]
+
+def solve_part_1_columns(columns) -> int:
+    import numpy
+
+    first, second = columns
+
+    return int(numpy.abs(numpy.sort(first) - numpy.sort(second)).sum())
+
+def solve_part_2_columns(columns) -> int:
+    ''' Counts of the second list by `bincount` when its values are small enough
+        to index a table, by binary search in the sorted list otherwise
+    '''
+    import numpy
+
+    first, second = columns
+    if len(first) == 0:
+        return 0
+
+    if 0 <= second.min() and second.max() < 4 * len(second) + (1 << 20):
+        counts = numpy.bincount(second)
+        present = (first >= 0) & (first < len(counts))
+        frequency = numpy.zeros_like(first)
+        frequency[present] = counts[first[present]]
+    else:
+        second = numpy.sort(second)
+        frequency = numpy.searchsorted(second, first, "right") - numpy.searchsorted(second, first, "left")
+
+    return int((first * frequency).sum())
+
+# Values read from a run at a time, and runs merged at once per column. Part 1
+# merges both columns together, so at most 2 * MAX_FAN_IN runs are open and
+# their buffers take 2 * MAX_FAN_IN * READ_BLOCK * 8 bytes (4 MiB)
+READ_BLOCK = 1 << 12
+MAX_FAN_IN = 64
+
+def write_run(values: array.array, path: str):
+    values = array.array("q", sorted(values))
+    with open(path, "wb") as file:
+        values.tofile(file)
+
+def read_run(path: str, block: int = READ_BLOCK) -> Iterator[int]:
+    with open(path, "rb") as file:
+        while True:
+            values = array.array("q")
+            try:
+                values.fromfile(file, block)
+            except EOFError:
+                yield from values
+                return
+            yield from values
+
+def spill_runs(filename: str, directory: str, chunk_lines: int) -> tuple[list[str], list[str]]:
+    ''' Sorted runs of at most `chunk_lines` values of each column, as int64 files in `directory` '''
+    runs = ([], [])
+    chunk = (array.array("q"), array.array("q"))
+
+    def spill():
+        for column, (values, paths) in enumerate(zip(chunk, runs)):
+            paths.append(os.path.join(directory, f"{column}-{len(paths)}.run"))
+            write_run(values, paths[-1])
+            del values[:]
+
+    with open(filename, "rb") as file:
+        for line in file:
+            if not (fields := line.split()):
+                continue
+
+            chunk[0].append(int(fields[0]))
+            chunk[1].append(int(fields[1]))
+            if len(chunk[0]) == chunk_lines:
+                spill()
+
+    if chunk[0] or not runs[0]:
+        spill()
+
+    return runs
+
+def merged(runs: list[str]) -> Iterator[int]:
+    return heapq.merge(*map(read_run, runs))
+
+def write_merged(runs: list[str], path: str, block: int = READ_BLOCK):
+    ''' One run of all of `runs`, which are deleted once merged '''
+    values = array.array("q")
+    with open(path, "wb") as file:
+        for value in merged(runs):
+            values.append(value)
+            if len(values) == block:
+                values.tofile(file)
+                del values[:]
+        values.tofile(file)
+
+    for run in runs:
+        os.remove(run)
+
+def compact(runs: list[str], fan_in: int = MAX_FAN_IN) -> list[str]:
+    ''' Runs merged `fan_in` at a time into longer ones, pass after pass, until
+        at most `fan_in` are left
+    '''
+    level = 0
+    while len(runs) > fan_in:
+        level += 1
+        longer = []
+        for start in range(0, len(runs), fan_in):
+            if len(group := runs[start:start + fan_in]) == 1:
+                longer += group
+                continue
+
+            longer.append(f"{os.path.splitext(group[0])[0]}-{level}.run")
+            write_merged(group, longer[-1])
+        runs = longer
+
+    return runs
+
+def counted(values: Iterable[int]) -> Iterator[tuple[int, int]]:
+    ''' (value, count) of a sorted stream '''
+    return ((value, sum(1 for _ in group)) for value, group in itertools.groupby(values))
+
+def similarity_of_sorted(first: Iterable[int], second: Iterable[int]) -> int:
+    ''' Merge join of both sorted lists, each value holding a count from each side '''
+    similarity = 0
+
+    second = counted(second)
+    value_2, count_2 = next(second, (None, 0))
+    for value_1, count_1 in counted(first):
+        while value_2 is not None and value_2 < value_1:
+            value_2, count_2 = next(second, (None, 0))
+
+        if value_2 == value_1:
+            similarity += value_1 * count_1 * count_2
+
+    return similarity
+
+def solve_streaming(
+    filename: str, chunk_lines: int = 1 << 20, directory: str | None = None, fan_in: int = MAX_FAN_IN
+) -> tuple[int, int]:
+    ''' Both parts for inputs larger than memory
+
+        The columns are spilled as sorted runs of `chunk_lines` values to a temporary
+        directory (inside `directory` if given), merged into at most `fan_in` longer
+        runs per column and k-way merged back. Memory is bounded by one chunk plus
+        a `READ_BLOCK` buffer for each of the at most `2 * fan_in` open runs. Each
+        part streams the final runs once.
+    '''
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir = directory) as runs_directory:
+        first, second = spill_runs(filename, runs_directory, chunk_lines)
+        first, second = compact(first, fan_in), compact(second, fan_in)
+
+        distance = sum(abs(x - y) for x, y in zip(merged(first), merged(second)))
+        similarity = similarity_of_sorted(merged(first), merged(second))
+
+    return distance, similarity
+
+def check(alternates: bool = False):
+    ''' The streaming and NumPy paths are only cross-checked when `alternates` is
+        set, `--alternates` on the command line, as importing NumPy alone costs
+        several times the whole day
+    '''
     input_small = read_and_parse("assets/day01/in_small.txt")
 
     part_1_answer = solve_part_1(input_small)
@@ -34,16 +209,26 @@ def check():
     part_2_answer = solve_part_2(input_small)
     assert part_2_answer == 31
 
+    if not alternates:
+        return
+
+    assert solve_streaming("assets/day01/in_small.txt", chunk_lines = 2, fan_in = 2) == (11, 31)
+
+    if lazy.numpy_available():
+        columns_small = read_columns("assets/day01/in_small.txt")
+        assert solve_part_1_columns(columns_small) == 11
+        assert solve_part_2_columns(columns_small) == 31
+
 def main():
     input = read_and_parse("assets/day01/in.txt")
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 3_569_916
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 26_407_426
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
-    check()
+    check(alternates = "--alternates" in sys.argv)
     main()
\ No newline at end of file
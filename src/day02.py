@@ -1,57 +1,137 @@
 #!/usr/bin/env python3
 
-import operator
-from typing import Iterable
+import sys
+
+import lazy
+import loader
+
+ANSWERS = (390, 439)
 
 Level = list[int]
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
 
 def read_levels(input: list[str]) -> list[Level]:
     return [list(map(int, line.split(" "))) for line in input]
 
-def is_monotonic(level: Level, min_difference, max_difference) -> bool:
-    neighbors = zip(level[:-1], level[1:])
-    differences = [operator.sub(*pair) for pair in neighbors]
+def is_monotonic(level: Level, min_difference: int, max_difference: int, removals: int = 0) -> bool:
+    ''' Whether removing at most `removals` values leaves every step within the bounds
+
+        `cost[i]` is the fewest removals before `i` leaving a valid run that ends at
+        `i`. Skipping more than `removals` values never helps, so only the previous
+        `removals + 1` values are candidates and the check is O(k * removals).
+        Without removals that is just every adjacent step being within the bounds.
+    '''
+    if removals == 0:
+        return all(min_difference <= b - a <= max_difference for a, b in zip(level, level[1:]))
 
-    return all(map(
-        lambda difference: min_difference <= difference <= max_difference, 
-        differences
-    ))
+    size = len(level)
+    cost = [0] * size
+    fewest = size
 
-def is_increasing(level: Level, min_difference=1, max_difference=3) -> bool:
-    return is_monotonic(level, min_difference, max_difference)
+    for i, value in enumerate(level):
+        cost_i = i
+        for j in range(i - removals - 1 if i > removals else 0, i):
+            if min_difference <= value - level[j] <= max_difference:
+                candidate = cost[j] + i - j - 1
+                if candidate < cost_i:
+                    cost_i = candidate
 
-def is_decreasing(level: Level, min_difference=-3, max_difference=-1) -> bool:
-    return is_monotonic(level, min_difference, max_difference)
+        cost[i] = cost_i
+        candidate = cost_i + size - 1 - i
+        if candidate < fewest:
+            fewest = candidate
 
-def is_level_monotonic(level: Level) -> bool:
-    return is_increasing(level) or is_decreasing(level)
+    return fewest <= removals
 
-def tolerate_level(level: Level) -> Iterable[list[Level]]:
-    for tolerate_index in range(len(level)):
-        yield level[:tolerate_index] + level[tolerate_index + 1:]
+def is_increasing(level: Level, min_difference=1, max_difference=3, removals=0) -> bool:
+    return is_monotonic(level, min_difference, max_difference, removals)
+
+def is_decreasing(level: Level, min_difference=-3, max_difference=-1, removals=0) -> bool:
+    return is_monotonic(level, min_difference, max_difference, removals)
+
+def is_level_monotonic(level: Level, removals: int = 0) -> bool:
+    return is_increasing(level, removals = removals) or is_decreasing(level, removals = removals)
 
 def solve_part_1(input: list[str]) -> int:
     levels = read_levels(input)
-    monotonic_levels = list(filter(is_level_monotonic, levels))
 
-    return len(monotonic_levels)
+    return sum(1 for level in levels if is_level_monotonic(level))
 
-def solve_part_2(input: list[str]) -> int:
+def solve_part_2(input: list[str], removals: int = 1) -> int:
     levels = read_levels(input)
 
-    monotonic_levels = list(filter(
-        lambda level: 
-            any(map(is_level_monotonic, tolerate_level(level))), 
-            levels
-    ))
+    return sum(1 for level in levels if is_level_monotonic(level, removals))
+
+def read_reports(filename: str):
+    ''' All reports as one zero padded int64 matrix and the mask of its real values
+
+        The digits are read as bytes and combined by numpy a digit place at a time,
+        so no Python object is created per report or per value.
+    '''
+    import numpy
+
+    buffer = numpy.fromfile(filename, dtype = numpy.uint8)
+    digits = (buffer >= ord("0")) & (buffer <= ord("9"))
+
+    starts = numpy.flatnonzero(digits & ~numpy.concatenate([[False], digits[:-1]]))
+    ends = numpy.flatnonzero(digits & ~numpy.concatenate([digits[1:], [False]])) + 1
+
+    values = numpy.zeros(len(starts), dtype = numpy.int64)
+    for place in range(int((ends - starts).max(initial = 0))):
+        inside = starts + place < ends
+        values[inside] = values[inside] * 10 + buffer[starts[inside] + place] - ord("0")
+    values[buffer[starts - 1] == ord("-")] *= -1
+
+    line = numpy.cumsum(buffer == ord("\n"))[starts]
+    lengths = numpy.bincount(line)
+    lengths = lengths[lengths > 0]
+
+    width = int(lengths.max(initial = 0))
+    mask = numpy.arange(width) < lengths[:, None]
+    reports = numpy.zeros(mask.shape, dtype = numpy.int64)
+    reports[mask] = values
 
-    return len(monotonic_levels)
+    return reports, mask
 
-def check():
+def steps_within(reports, mask, min_difference: int, max_difference: int, gap: int = 1):
+    ''' Whether every step `gap` values apart is within the bounds, steps into the padding always are '''
+    steps = reports[:, gap:] - reports[:, :-gap]
+
+    return ((min_difference <= steps) & (steps <= max_difference)) | ~mask[:, gap:]
+
+def safe_reports(reports, mask, min_difference: int, max_difference: int, removals: int):
+    ''' Only a single removal is vectorised, `is_monotonic` handles any number '''
+    assert removals in (0, 1), f"{removals} removals, only 0 or 1 are supported"
+
+    import numpy
+
+    within = steps_within(reports, mask, min_difference, max_difference)
+    safe = within.all(axis = 1)
+    if removals == 0 or reports.shape[1] < 3:
+        return safe | (removals > 0)
+
+    # Without value r: steps before r - 1, steps after r + 1 and the step over r
+    true = numpy.ones((len(reports), 1), dtype = bool)
+    prefix = numpy.hstack([true, numpy.logical_and.accumulate(within, axis = 1)])
+    suffix = numpy.hstack([numpy.logical_and.accumulate(within[:, ::-1], axis = 1)[:, ::-1], true])
+    over = numpy.hstack([true, steps_within(reports, mask, min_difference, max_difference, gap = 2), true])
+
+    return safe | (numpy.hstack([true, prefix[:, :-1]]) & over & numpy.hstack([suffix[:, 1:], true])).any(axis = 1)
+
+def count_safe_reports(reports_and_mask, removals: int) -> int:
+    ''' Vectorised part 1 (`removals = 0`) and part 2 (`removals = 1`) '''
+    reports, mask = reports_and_mask
+
+    safe = safe_reports(reports, mask, 1, 3, removals) | safe_reports(reports, mask, -3, -1, removals)
+
+    return int(safe.sum())
+
+def check(alternates: bool = False):
+    ''' The NumPy path is only cross-checked when `alternates` is set, `--alternates`
+        on the command line, as importing NumPy costs more than the day itself
+    '''
     input_small = read_and_parse("assets/day02/in_small.txt")
 
     part_1_answer = solve_part_1(input_small)
@@ -59,16 +139,21 @@ def check():
     part_2_answer = solve_part_2(input_small)
     assert part_2_answer == 4
 
+    if alternates and lazy.numpy_available():
+        reports_small = read_reports("assets/day02/in_small.txt")
+        assert count_safe_reports(reports_small, 0) == 2
+        assert count_safe_reports(reports_small, 1) == 4
+
 def main():
     input = read_and_parse("assets/day02/in.txt")
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 390
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 439
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
-    check()
+    check(alternates = "--alternates" in sys.argv)
     main()
\ No newline at end of file
@@ -1,63 +1,131 @@
 #!/usr/bin/env python3
 
 import collections
-import operator
-import re
 
-State = collections.namedtuple(
-    "State", ["reg", "accumulate"]
-)
-
-Operation = collections.namedtuple(
-    "Operation", ["mul", "do", "do_not"]
-)
-
-re_mul = r"mul\((\d{1,3}),(\d{1,3})\)"
-
-re_operations = r"(mul\(\d{1,3},\d{1,3}\))|(do\(\))|(don't\(\))"
-
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+import lazy
+import loader
 
-def calculate_sum(line: str) -> int:
-    pairs = re.findall(re_mul, line)
-    result = sum(map(lambda pair: operator.mul(*map(int, pair)), pairs))
+ANSWERS = (156_388_521, 75_920_122)
 
-    return result
+re_tokens = lazy.Pattern(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
 
-def apply_operation(state: State, operation: Operation) -> State:
-    if operation.mul:
-        return State(
-            reg = state.reg,
-            accumulate = state.accumulate + state.reg * calculate_sum(operation.mul)
-        )
-    elif operation.do:
-        return State(
-            reg = 1,
-            accumulate = state.accumulate
-        )
-    else:
-        return State(
-            reg = 0,
-            accumulate = state.accumulate
-        )
+# Longest token is `mul(123,456)`, a chunk's scan runs this far into the next one
+MAX_TOKEN = 12
 
-def solve_part_1(input: list[str]):
-    result = sum(map(calculate_sum, input))
-
-    return result
-
-def solve_part_2(input: list[str]):
-    state = State(reg = 1, accumulate = 0)
-
-    for line in input:
-        matches = re.findall(re_operations, line)
-
-        for match in matches:
-            state = apply_operation(state, Operation(*match))
+Summary = collections.namedtuple(
+    "Summary", ["total", "enabled", "disabled", "toggle"]
+)
 
-    return state.accumulate
+def read_and_parse(filename: str) -> bytes:
+    ''' The raw file, tokens never span lines and `don't()` carries over them '''
+    return loader.Input(filename).buffer
+
+def sum_products(buffer: bytes, conditional: bool) -> int:
+    ''' Single pass over `buffer` jumping between `mul(` and `do` with `find`
+
+        Only the at most 8 bytes of a `mul(` argument list are looked at in Python.
+        While disabled the scan jumps straight to the next `do()`.
+    '''
+    total = 0
+
+    mul = buffer.find(b"mul(")
+    do = buffer.find(b"don't()") if conditional else -1
+    while mul >= 0:
+        if 0 <= do < mul:
+            if (mul := buffer.find(b"do()", do + 7)) < 0:
+                break
+            do = buffer.find(b"don't()", mul + 4)
+            mul = buffer.find(b"mul(", mul + 4)
+            continue
+
+        start = mul + 4
+        arguments, close, _ = buffer[start:start + 8].partition(b")")
+        if close:
+            first, _, second = arguments.partition(b",")
+            if first.isdigit() and second.isdigit() and len(first) <= 3 and len(second) <= 3:
+                total += int(first) * int(second)
+
+        mul = buffer.find(b"mul(", start)
+
+    return total
+
+def sum_products_regex(buffer: bytes, conditional: bool) -> int:
+    ''' Same as `sum_products` with one regex pass
+
+        Faster for part 1, where every `mul(` is examined and the regex does it
+        in C, slower for part 2 where `sum_products` skips the disabled stretches.
+    '''
+    total, enabled = 0, True
+    for first, second, do, do_not in re_tokens.findall(buffer):
+        if do:
+            enabled = True
+        elif do_not:
+            enabled = not conditional
+        elif enabled:
+            total += int(first) * int(second)
+
+    return total
+
+def solve_part_1(input: bytes) -> int:
+    return sum_products_regex(input, conditional = False)
+
+def solve_part_2(input: bytes) -> int:
+    return sum_products(input, conditional = True)
+
+def scan_chunk(filename: str, start: int, end: int) -> Summary:
+    ''' Products of the tokens starting in `[start, end)` of the raw file
+
+        The chunk can't know whether it is entered with `mul` enabled, so it sums
+        both cases; `toggle` is the state its last `do()`/`don't()` leaves, None
+        if it has none.
+    '''
+    buffer = loader.Input(filename).buffer
+
+    total, enabled, disabled = 0, 0, 0
+    state_enabled, state_disabled = True, False
+    toggle = None
+
+    for match in re_tokens.finditer(buffer, start, min(end + MAX_TOKEN - 1, len(buffer))):
+        if match.start() >= end:
+            break
+
+        first, second, do, _ = match.groups()
+        if do is not None:
+            state_enabled = state_disabled = toggle = True
+        elif first is None:
+            state_enabled = state_disabled = toggle = False
+        else:
+            product = int(first) * int(second)
+            total += product
+            enabled += product if state_enabled else 0
+            disabled += product if state_disabled else 0
+
+    return Summary(total, enabled, disabled, toggle)
+
+def combine(summaries: list[Summary]) -> tuple[int, int]:
+    total, accumulate, state = 0, 0, True
+    for summary in summaries:
+        total += summary.total
+        accumulate += summary.enabled if state else summary.disabled
+        if summary.toggle is not None:
+            state = summary.toggle
+
+    return total, accumulate
+
+def solve_chunked(filename: str, jobs: int | None = None, chunk_size: int = 1 << 20) -> tuple[int, int]:
+    ''' Both parts from chunks of the raw file scanned in a process pool of `jobs`
+        workers (in this process if `jobs` is 1), each mapping the file itself
+    '''
+    size = len(loader.Input(filename))
+    chunks = [(filename, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+    if jobs == 1 or len(chunks) <= 1:
+        return combine([scan_chunk(*chunk) for chunk in chunks])
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers = jobs) as executor:
+        return combine(list(executor.map(scan_chunk, *zip(*chunks))))
 
 def check():
     input_small = read_and_parse("assets/day03/in_small.txt")
@@ -67,15 +135,19 @@ def check():
     part_2_answer = solve_part_2(input_small)
     assert part_2_answer == 48
 
+    assert sum_products(input_small, conditional = False) == 161
+    assert sum_products_regex(input_small, conditional = True) == 48
+    assert solve_chunked("assets/day03/in_small.txt", jobs = 1, chunk_size = 5) == (161, 48)
+
 def main():
     input = read_and_parse("assets/day03/in.txt")
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 156_388_521
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 75_920_122
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
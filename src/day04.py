@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
-Grid = list[str]
+import collections
+import sys
 
-DIRS = [(di, dj) for di in range(-1, 2) for dj in range(-1, 2)]
+import lazy
+import loader
+
+ANSWERS = (2_569, 1_998)
+
+Grid = loader.GridView
 
 DIAG_PRIMARY = [
     [(-1, -1), (0, 0), (1, 1)],
@@ -14,70 +20,217 @@ DIAG_SECONDARY = [
 ]
 
 XMAS = "XMAS"
-MAS = "MAS"
+MAS = b"MAS"
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+def read_and_parse(filename: str) -> Grid:
+    return loader.read_grid(filename)
     
-def is_valid(i: int, j: int, grid: Grid) -> bool:
-    assert len(grid) != 0
-
-    return 0 <= i < len(grid) and 0 <= j < len(grid[0])
-
-def get_letter(i: int, j: int, grid: Grid) -> str:
-    if is_valid(i, j, grid):
-        return grid[i][j]
-    else:
-        return ""
-
-def search_xmas(i: int, j: int, grid: Grid) -> int:
-    cnt = 0
-    for di, dj in DIRS:
-        word = "".join(
-            get_letter(i + step * di, j + step * dj, grid) 
-            for step in range(len(XMAS))
-        )
-        
-        if word == XMAS:
-            cnt += 1
+class WordSearch:
+    ''' Every row, column and diagonal of a letter grid joined once into one text
+
+        A word read in any of the 8 directions is the word or its reverse on one of
+        those lines, so counting it is two plain searches over the text. Lines are
+        joined with a newline so no match runs from one into the next. The text is
+        bytes sliced from the mapped input, nothing is decoded.
+    '''
+    def __init__(self, grid: Grid):
+        height, width = grid.height, grid.width
+        rows = [grid.buffer[i * grid.stride:i * grid.stride + width] for i in range(height)]
+        flipped = [row[::-1] for row in rows]
+
+        lines = list(rows)
+        lines += [bytes(column) for column in zip(*rows)]
+        for diagonal_rows in (rows, flipped):
+            lines += [
+                bytes(diagonal_rows[i][i + d] for i in range(max(0, -d), min(height, width - d)))
+                for d in range(1 - height, width)
+            ]
+
+        self.text = b"\n".join(lines)
+
+    def occurrences(self, word: bytes) -> int:
+        ''' Overlapping occurrences, `bytes.count` is enough unless the word overlaps itself '''
+        if not any(word[:k] == word[-k:] for k in range(1, len(word))):
+            return self.text.count(word)
+
+        count, start = 0, self.text.find(word)
+        while start >= 0:
+            count += 1
+            start = self.text.find(word, start + 1)
+
+        return count
+
+    def count(self, word: str) -> int:
+        ''' Occurrences of `word` in all 8 directions '''
+        word = word.encode()
+        if len(word) == 1:
+            return self.text.count(word) // 4
+
+        return self.occurrences(word) + self.occurrences(word[::-1])
 
-    return cnt
+    def count_all(self, words: list[str]) -> dict[str, int]:
+        ''' `count` of every word from a single Aho-Corasick pass over the text
+
+            Every word and its reverse is a pattern. The automaton's nodes are the
+            prefixes of the patterns, a node's `fail` link its longest proper suffix
+            that is a node too, so each letter costs amortised O(1) and only how
+            often every node is reached needs counting during the pass.
+        '''
+        words = list(dict.fromkeys(words))
+
+        # The words each pattern counts towards, a palindrome twice like in `count`
+        owners = collections.defaultdict(list)
+        for word in words:
+            owners[word].append(word)
+            owners[word[::-1]].append(word)
+
+        goto, fail, patterns = [{}], [0], [[]]
+        for pattern in owners:
+            node = 0
+            for letter in pattern.encode():
+                if letter not in goto[node]:
+                    goto[node][letter] = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    patterns.append([])
+                node = goto[node][letter]
+            patterns[node].append(pattern)
+
+        # Breadth first, so a node's fail link is final before its children need it
+        order = list(goto[0].values())
+        for node in order:
+            for letter, child in goto[node].items():
+                link = fail[node]
+                while link and letter not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(letter, 0)
+                patterns[child] += patterns[fail[child]]
+                order.append(child)
+
+        reached = [0] * len(goto)
+        node = 0
+        for letter in self.text:
+            while node and letter not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(letter, 0)
+            reached[node] += 1
+
+        counts = dict.fromkeys(words, 0)
+        for node, times in enumerate(reached):
+            for pattern in patterns[node] if times else ():
+                for word in owners[pattern]:
+                    counts[word] += times
+
+        # A single letter is on 4 lines of the text and its own reverse
+        for word in words:
+            if len(word) == 1:
+                counts[word] //= 8
+
+        return counts
 
 def search_x_mas(i: int, j: int, grid: Grid) -> int:
+    # Both diagonals run off the grid around a cell on its edge
+    if not (0 < i < grid.height - 1 and 0 < j < grid.width - 1):
+        return False
+
+    buffer, stride = grid.buffer, grid.stride
+
     diag_primary = False
     for diag in DIAG_PRIMARY:
-        word = "".join(
-            get_letter(i + di, j + dj, grid) 
+        word = bytes(
+            buffer[(i + di) * stride + j + dj] 
             for di, dj in diag
         )
         diag_primary |= word == MAS
 
     diag_secondary = False
     for diag in DIAG_SECONDARY:
-        word = "".join(
-            get_letter(i + di, j + dj, grid) 
+        word = bytes(
+            buffer[(i + di) * stride + j + dj] 
             for di, dj in diag
         )
         diag_secondary |= word == MAS
 
     return diag_primary and diag_secondary
 
-def solve_part_1(grid: list[str]):
-    return sum(
-        search_xmas(i, j, grid) 
-        for i in range(len(grid)) 
-        for j in range(len(grid[0]))
-    )
+Stencil = list[str]
+
+WILDCARD = "."
+
+X_MAS = [
+    "M.S",
+    ".A.",
+    "M.S",
+]
+
+def rotations(stencil: Stencil, distinct: bool = True) -> list[Stencil]:
+    ''' The stencil turned by 0, 90, 180 and 270 degrees, repeats dropped if `distinct` '''
+    turned = [stencil]
+    for _ in range(3):
+        turned.append(["".join(row) for row in zip(*turned[-1][::-1])])
+
+    if not distinct:
+        return turned
+
+    return [stencil for k, stencil in enumerate(turned) if stencil not in turned[:k]]
+
+def word_stencils(word: str) -> list[Stencil]:
+    ''' The word in all 8 directions, so palindromes count twice like `WordSearch.count` '''
+    diagonal = [WILDCARD * k + letter + WILDCARD * (len(word) - k - 1) for k, letter in enumerate(word)]
+
+    return rotations([word], distinct = False) + rotations(diagonal, distinct = False)
+
+def read_letters(filename: str):
+    ''' The grid as a `uint8` matrix, straight from the file '''
+    import numpy
 
-def solve_part_2(grid: list[str]):
+    buffer = numpy.fromfile(filename, dtype = numpy.uint8)
+    width = int(numpy.argmax(buffer == ord("\n"))) if (buffer == ord("\n")).any() else len(buffer)
+    if len(buffer) % (width + 1):
+        buffer = numpy.append(buffer, numpy.uint8(ord("\n")))
+
+    return buffer.reshape(-1, width + 1)[:, :width]
+
+def stencil_matches(letters, stencil: Stencil):
+    ''' Boolean matrix of the top left corners where `stencil` matches
+
+        Every letter of the stencil compares one shifted slice of the grid, so the
+        whole grid is tested at once for each of them.
+    '''
+    import numpy
+
+    height, width = letters.shape
+    stencil_height, stencil_width = len(stencil), max(map(len, stencil))
+    corners = (height - stencil_height + 1, width - stencil_width + 1)
+    if min(corners) <= 0:
+        return numpy.zeros((0, 0), dtype = bool)
+
+    matches = numpy.ones(corners, dtype = bool)
+    for di, row in enumerate(stencil):
+        for dj, letter in enumerate(row):
+            if letter != WILDCARD:
+                matches &= letters[di:di + corners[0], dj:dj + corners[1]] == ord(letter)
+
+    return matches
+
+def count_stencils(letters, stencils: list[Stencil]) -> int:
+    return sum(int(stencil_matches(letters, stencil).sum()) for stencil in stencils)
+
+def solve_part_1(grid: Grid):
+    return WordSearch(grid).count(XMAS)
+
+def solve_part_2(grid: Grid):
     return sum(
         search_x_mas(i, j, grid) 
-        for i in range(len(grid)) 
-        for j in range(len(grid[0]))
+        for i in range(grid.height) 
+        for j in range(grid.width)
     )
 
-def check():
+def check(alternates: bool = False):
+    ''' The NumPy stencils are only cross-checked when `alternates` is set,
+        `--alternates` on the command line, as importing NumPy costs more than
+        the day itself
+    '''
     input_small = read_and_parse("assets/day04/in_small.txt")
 
     part_1_answer = solve_part_1(input_small)
@@ -85,16 +238,21 @@ def check():
     part_2_answer = solve_part_2(input_small)
     assert part_2_answer == 9
 
+    if alternates and lazy.numpy_available():
+        letters_small = read_letters("assets/day04/in_small.txt")
+        assert count_stencils(letters_small, word_stencils(XMAS)) == 18
+        assert count_stencils(letters_small, rotations(X_MAS)) == 9
+
 def main():
     input = read_and_parse("assets/day04/in.txt")
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 2_569
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 1_998
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
-    check()
+    check(alternates = "--alternates" in sys.argv)
     main()
\ No newline at end of file
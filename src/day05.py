@@ -1,20 +1,97 @@
 #!/usr/bin/env python3
 
-Rules = dict[int, list[int]]
+import heapq
+
+import cache
+import loader
+
+ANSWERS = (5_268, 5_799)
+
 Update = list[int]
 Updates = list[Update]
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+class Rules:
+    ''' Ordering rules as bitsets over the pages
+
+        Bit `v` of `successors[u]` (and bit `u` of `predecessors[v]`) is set for a
+        rule `u|v`, so the rules between the pages of an update are a mask away.
+    '''
+    def __init__(self):
+        self.successors = {}
+        self.predecessors = {}
+
+    def __contains__(self, rule: tuple[int, int]) -> bool:
+        u, v = rule
+
+        return bool(self.successors.get(u, 0) >> v & 1)
+
+    def add(self, u: int, v: int):
+        self.successors[u] = self.successors.get(u, 0) | 1 << v
+        self.predecessors[v] = self.predecessors.get(v, 0) | 1 << u
+
+    def remove(self, u: int, v: int):
+        self.successors[u] = self.successors.get(u, 0) & ~(1 << v)
+        self.predecessors[v] = self.predecessors.get(v, 0) & ~(1 << u)
+
+    def is_ordered(self, update: Update) -> bool:
+        ''' No page has a rule to one printed before it '''
+        seen = 0
+        for page in update:
+            if self.successors.get(page, 0) & seen:
+                return False
+            seen |= 1 << page
+
+        return True
+
+    def reorder(self, update: Update) -> Update:
+        ''' Kahn's algorithm over the rules between the update's pages
+
+            Ready pages are taken in their original order, so an ordered update
+            comes back unchanged.
+        '''
+        pages = 0
+        for page in update:
+            pages |= 1 << page
+
+        position = {page: i for i, page in enumerate(update)}
+        waiting = {page: (self.predecessors.get(page, 0) & pages).bit_count() for page in update}
+        ready = [i for i, page in enumerate(update) if waiting[page] == 0]
+
+        ordered = []
+        while ready:
+            page = update[heapq.heappop(ready)]
+            ordered.append(page)
+
+            successors = self.successors.get(page, 0) & pages
+            while successors:
+                low = successors & -successors
+                successors ^= low
+
+                successor = low.bit_length() - 1
+                waiting[successor] -= 1
+                if waiting[successor] == 0:
+                    heapq.heappush(ready, position[successor])
+
+        if len(ordered) != len(update):
+            raise ValueError("rules between the pages of an update have a cycle")
+
+        return ordered
+
+def read_and_parse(filename: str) -> tuple[Rules, Updates]:
+    return cache.parsed(filename, parse)
+
+def parse(filename: str) -> tuple[Rules, Updates]:
+    input = loader.read_blocks(filename)
+
+    return parse_rules(input[0]), parse_updates(input[1])
     
 def parse_rules(input: str) -> Rules:
     lines = input.splitlines()
 
-    rules = {}
+    rules = Rules()
     for line in lines:
         u, v = map(int, line.split("|"))
-        rules.setdefault(u, []).append(v)
+        rules.add(u, v)
 
     return rules
 
@@ -23,54 +100,86 @@ def parse_updates(input: str) -> Updates:
 
     return [list(map(int, line.split(","))) for line in lines]
 
-def dfs(ind: int, rules: Rules, update: Update, used: list[bool], ans: list[int]):
-    used[ind] = True
+def middle(update: Update) -> int:
+    return update[len(update) // 2]
 
-    for to in rules.get(update[ind], []):
-        if to in update:
-            to_ind = update.index(to)
-            if not used[to_ind]:
-                dfs(to_ind, rules, update, used, ans)
+class PrintQueue:
+    ''' Verdict and middle page of every update, kept current as rules change
 
-    ans.append(update[ind])
+        A rule `u|v` only matters to the updates printing both pages, so adding or
+        removing it re-evaluates those alone and adjusts the running totals. A rule
+        closing a cycle between the pages of some update is rejected, leaving the
+        queue as it was.
+    '''
+    def __init__(self, rules: Rules, updates: Updates):
+        self.rules = rules
+        self.updates = updates
 
-def topological_sort(update: Update, rules: Rules) -> list[int]:
-    ans = []
-    n = len(update)
-    used = [False] * n
+        self.containing = {}
+        for index, update in enumerate(updates):
+            for page in update:
+                self.containing.setdefault(page, set()).add(index)
 
-    for ind in range(n):
-        if not used[ind]:
-            dfs(ind, rules, update, used, ans)
+        self.ordered = [False] * len(updates)
+        self.middles = [0] * len(updates)
+        self.totals = [0, 0]
+        self.apply({index: self.evaluate(index) for index in range(len(updates))})
 
-    ans.reverse()
+    def evaluate(self, index: int) -> tuple[bool, int]:
+        ''' Whether the update is ordered and its middle page once ordered '''
+        update = self.updates[index]
+        if self.rules.is_ordered(update):
+            return True, middle(update)
 
-    return ans
+        return False, middle(self.rules.reorder(update))
 
+    def apply(self, verdicts: dict[int, tuple[bool, int]]):
+        ''' Swaps the old contributions of the updates for the new ones '''
+        for index, (ordered, page) in verdicts.items():
+            self.totals[not self.ordered[index]] -= self.middles[index]
+            self.ordered[index], self.middles[index] = ordered, page
+            self.totals[not ordered] += page
 
-def solve_part_1(input: list[str]):
-    rules = parse_rules(input[0])
-    updates = parse_updates(input[1])
+    def affected(self, u: int, v: int) -> set[int]:
+        return self.containing.get(u, set()) & self.containing.get(v, set())
 
-    ans = 0
-    for update in updates:
-        fixed_update = topological_sort(update, rules)
-        if fixed_update == update:
-            ans += fixed_update[len(fixed_update) // 2]
+    def add_rule(self, u: int, v: int):
+        if (u, v) in self.rules:
+            return
 
-    return ans
+        self.rules.add(u, v)
+        try:
+            verdicts = {index: self.evaluate(index) for index in self.affected(u, v)}
+        except ValueError:
+            self.rules.remove(u, v)
+            raise
 
-def solve_part_2(input: list[str]):
-    rules = parse_rules(input[0])
-    updates = parse_updates(input[1])
+        self.apply(verdicts)
 
-    ans = 0
-    for update in updates:
-        fixed_update = topological_sort(update, rules)
-        if fixed_update != update:
-            ans += fixed_update[len(fixed_update) // 2]
+    def remove_rule(self, u: int, v: int):
+        if (u, v) not in self.rules:
+            return
 
-    return ans
+        self.rules.remove(u, v)
+        self.apply({index: self.evaluate(index) for index in self.affected(u, v)})
+
+    @property
+    def part_1(self) -> int:
+        return self.totals[0]
+
+    @property
+    def part_2(self) -> int:
+        return self.totals[1]
+
+def solve_part_1(input: tuple[Rules, Updates]):
+    rules, updates = input
+
+    return sum(middle(update) for update in updates if rules.is_ordered(update))
+
+def solve_part_2(input: tuple[Rules, Updates]):
+    rules, updates = input
+
+    return sum(middle(rules.reorder(update)) for update in updates if not rules.is_ordered(update))
 
 def check():
     input_small = read_and_parse("assets/day05/in_small.txt")
@@ -80,15 +189,29 @@ def check():
     part_2_answer = solve_part_2(input_small)
     assert part_2_answer == 123
 
+    queue = PrintQueue(*read_and_parse("assets/day05/in_small.txt"))
+    assert (queue.part_1, queue.part_2) == (143, 123)
+    queue.remove_rule(97, 75)
+    input = (queue.rules, queue.updates)
+    assert (queue.part_1, queue.part_2) == (solve_part_1(input), solve_part_2(input)) != (143, 123)
+    queue.add_rule(97, 75)
+    assert (queue.part_1, queue.part_2) == (143, 123)
+    try:
+        queue.add_rule(75, 97)
+    except ValueError:
+        assert (75, 97) not in queue.rules and (queue.part_1, queue.part_2) == (143, 123)
+    else:
+        assert False, "75|97 closes a cycle with 97|75"
+
 def main():
     input = read_and_parse("assets/day05/in.txt")
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 5_268
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 5_799
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
@@ -1,95 +1,174 @@
 #!/usr/bin/env python3
 
-Grid = list[list[str]]
+import bisect
 
-DIRS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+import loader
+from grid import Grid
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+ANSWERS = (4_826, 1_721)
 
-def build_grid(input: list[str]) -> Grid:
-    return [list(line) for line in input]
+OBSTACLE = ord("#")
 
-def is_out(i: int, j: int, grid: Grid) -> bool:
-    n = len(grid)
-    m = len(grid[0])
+def read_and_parse(filename: str) -> loader.GridView:
+    return loader.read_grid(filename)
 
-    return i < 0 or j < 0 or i >= n or j >= m
+def build_grid(input: loader.GridView) -> Grid:
+    return Grid.from_view(input)
 
-def is_obstacle(i: int, j: int, grid: Grid) -> bool:
-    return grid[i][j] == "#"
+def is_out(index: int, grid: Grid) -> bool:
+    return grid[index] == Grid.BORDER
 
-def find_initial_pos(grid: Grid) -> tuple[int, int]:
-    for i, row in enumerate(grid):
-        for j, cell in enumerate(row):
-            if cell == "^":
-                return i, j
+def is_obstacle(index: int, grid: Grid) -> bool:
+    return grid[index] == OBSTACLE
 
-def traverse_path(dir: int, i: int, j: int, grid: Grid, seen: Grid) -> bool:
+def find_initial_pos(grid: Grid) -> int:
+    return grid.find(b"^")
+
+def traverse_path(dir: int, index: int, grid: Grid, seen: bytearray) -> bool:
     while True:
-        seen[i][j][dir] = True
-        to_i, to_j = i + DIRS[dir][0], j + DIRS[dir][1]
+        seen[index] |= 1 << dir
+        to_index = index + grid.dirs[dir]
 
-        if is_out(to_i, to_j, grid):
+        if is_out(to_index, grid):
             return True
 
-        while is_obstacle(to_i, to_j, grid):
-            dir = (dir + 1) % len(DIRS)
-            to_i, to_j = i + DIRS[dir][0], j + DIRS[dir][1]
-
-        assert not is_obstacle(to_i, to_j, grid)
-
-        if not seen[to_i][to_j][dir]:
-            i, j = to_i, to_j
+        if is_obstacle(to_index, grid):
+            dir = (dir + 1) % len(grid.dirs)
+        elif not seen[to_index] & (1 << dir):
+            index = to_index
         else:
             return False
         
-def check_obstacle_at(i: int, j: int, st_i: int, st_j: int, g: bool, grid: Grid) -> bool:
-    if grid[i][j] == "." and g:
-        n = len(grid)
-        m = len(grid[0])
-        grid[i][j] = '#'
-        seen = [[[False] * len(DIRS) for _ in range(m)] for _ in range(n)]
-        loop = not traverse_path(0, st_i, st_j, grid, seen)
-        grid[i][j] = '.'
-        
-        return loop
-    else:
+class Jumps:
+    ''' Obstacles by row and by column, sorted, so the guard jumps from turn to turn
+
+        Points are `(i, j)` and directions index `Grid.dirs` (up, right, down, left).
+        `extra` is one more obstacle on top of the grid's, e.g. a part 2 candidate.
+    '''
+    def __init__(self, grid: Grid):
+        self.rows = [[] for _ in range(grid.height)]
+        self.columns = [[] for _ in range(grid.width)]
+
+        # Turn states seen by the current `is_loop` carry its generation, so the
+        # array is reused for every walk without being cleared
+        self.width = grid.width
+        self.stamps = [0] * (grid.height * grid.width * 4)
+        self.generation = 0
+
+        # Row major, so every list comes out sorted
+        for index in grid.indices():
+            if grid[index] == OBSTACLE:
+                i, j = grid.point(index)
+                self.rows[i].append(j)
+                self.columns[j].append(i)
+
+    def next_turn(self, i: int, j: int, dir: int, extra: tuple[int, int] | None = None) -> tuple[int, int] | None:
+        ''' Where the guard stops in front of an obstacle, None if it walks off the grid '''
+        if dir == 0:
+            column = self.columns[j]
+            k = bisect.bisect_left(column, i) - 1
+            stop = column[k] if k >= 0 else None
+            if extra is not None and extra[1] == j and extra[0] < i and (stop is None or extra[0] > stop):
+                stop = extra[0]
+            return None if stop is None else (stop + 1, j)
+
+        if dir == 1:
+            row = self.rows[i]
+            k = bisect.bisect_right(row, j)
+            stop = row[k] if k < len(row) else None
+            if extra is not None and extra[0] == i and extra[1] > j and (stop is None or extra[1] < stop):
+                stop = extra[1]
+            return None if stop is None else (i, stop - 1)
+
+        if dir == 2:
+            column = self.columns[j]
+            k = bisect.bisect_right(column, i)
+            stop = column[k] if k < len(column) else None
+            if extra is not None and extra[1] == j and extra[0] > i and (stop is None or extra[0] < stop):
+                stop = extra[0]
+            return None if stop is None else (stop - 1, j)
+
+        row = self.rows[i]
+        k = bisect.bisect_left(row, j) - 1
+        stop = row[k] if k >= 0 else None
+        if extra is not None and extra[0] == i and extra[1] < j and (stop is None or extra[1] > stop):
+            stop = extra[1]
+        return None if stop is None else (i, stop + 1)
+
+    def is_loop(self, i: int, j: int, dir: int, extra: tuple[int, int] | None = None) -> bool:
+        ''' Only turns are remembered, a loop is reaching the same turn heading the same way '''
+        self.generation += 1
+        generation, stamps, width = self.generation, self.stamps, self.width
+
+        while (turn := self.next_turn(i, j, dir, extra)) is not None:
+            i, j = turn
+            state = (i * width + j) * 4 + dir
+            if stamps[state] == generation:
+                return True
+            stamps[state] = generation
+            dir = (dir + 1) % 4
+
         return False
 
-def solve_part_1(input: list[str]):
+Candidate = tuple[int, int, int, tuple[int, int]]
+
+def path_candidates(grid: Grid, st_index: int) -> list[Candidate]:
+    ''' Walks the original path once, every cell entered for the first time is a
+        candidate obstacle along with the guard's `(i, j, dir)` just before it
+
+        The guard's walk up to there doesn't touch the cell, so testing it resumes
+        from that state instead of starting over.
+    '''
+    seen = bytearray(len(grid))
+
+    candidates = []
+    index, dir = st_index, 0
+    while not seen[index] & (1 << dir):
+        seen[index] |= 1 << dir
+        to_index = index + grid.dirs[dir]
+
+        if is_out(to_index, grid):
+            break
+
+        if is_obstacle(to_index, grid):
+            dir = (dir + 1) % len(grid.dirs)
+            continue
+
+        if not seen[to_index] and to_index != st_index:
+            candidates.append((*grid.point(index), dir, grid.point(to_index)))
+        index = to_index
+
+    return candidates
+
+def count_loops(jumps: Jumps, candidates: list[Candidate]) -> int:
+    return sum(jumps.is_loop(i, j, dir, obstacle) for i, j, dir, obstacle in candidates)
+
+def solve_part_1(input: loader.GridView):
     grid = build_grid(input)
-    n = len(grid)
-    m = len(grid[0])
 
-    seen = [[[False] * len(DIRS) for _ in range(m)] for _ in range(n)]
-    st_i, st_j = find_initial_pos(grid)
+    seen = bytearray(len(grid))
+    st_index = find_initial_pos(grid)
 
-    traverse_path(0, st_i, st_j, grid, seen)
-    ans = sum(
-        sum(map(any, line)) 
-        for line in seen
-    )
+    traverse_path(0, st_index, grid, seen)
+    ans = len(seen) - seen.count(0)
 
     return ans
 
-def solve_part_2(input: list[str]):
+def solve_part_2(input: loader.GridView, jobs: int = 1):
+    ''' Candidates are split in `jobs` chunks for a process pool when `jobs` > 1 '''
     grid = build_grid(input)
-    n = len(grid)
-    m = len(grid[0])
-
-    st_i, st_j = find_initial_pos(grid)
-    initital = [[[False] * len(DIRS) for _ in range(m)] for _ in range(n)]
-    traverse_path(0, st_i, st_j, grid, initital)
-
-    ans = sum(
-        check_obstacle_at(i, j, st_i, st_j, any(initital[i][j]), grid) 
-        for j in range(m) 
-        for i in range(n)
-    )
-                
-    return ans
+
+    jumps = Jumps(grid)
+    candidates = path_candidates(grid, find_initial_pos(grid))
+
+    if jobs <= 1:
+        return count_loops(jumps, candidates)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [candidates[k::jobs] for k in range(jobs)]
+    with ProcessPoolExecutor(max_workers = jobs) as executor:
+        return sum(executor.map(count_loops, [jumps] * jobs, chunks))
 
 def check():
     input_small = read_and_parse("assets/day06/in_small.txt")
@@ -98,16 +177,17 @@ def check():
     assert part_1_answer == 41
     part_2_answer = solve_part_2(input_small)
     assert part_2_answer == 6
+    assert solve_part_2(input_small, jobs = 2) == 6
 
 def main():
     input = read_and_parse("assets/day06/in.txt")
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 4_826
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 1_721
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
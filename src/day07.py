@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
 
-import math
 import itertools
-from enum import Enum
 
-class Operation(Enum):
+import loader
+
+ANSWERS = (1_298_300_076_754, 248_427_118_972_289)
+
+class Operation:
     Mul = 1
     Add = 2
     Concat = 3
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
     
 def parse_equation(line: str) -> tuple[int, list[int]]:
     target, numbers = tuple(map(str.strip, line.split(":")))
@@ -20,27 +21,44 @@ def parse_equation(line: str) -> tuple[int, list[int]]:
 
     return target, numbers
 
+def is_solvable(target: int, numbers: list[int], operations: list[Operation]) -> bool:
+    ''' Works back from `target`, peeling the last number off with the inverse of
+        each operation: subtract it, divide by it if it divides, strip it if the
+        value ends in its digits
+
+        Most inverses don't apply, so few branches survive, and the search stops at
+        the first one that reaches the first number.
+    '''
+    add = Operation.Add in operations
+    mul = Operation.Mul in operations
+    concat = Operation.Concat in operations
+    powers = [10 ** len(str(number)) for number in numbers] if concat else []
+
+    stack = [(target, len(numbers) - 1)]
+    while stack:
+        value, k = stack.pop()
+        number = numbers[k]
+
+        if k == 0:
+            if value == number:
+                return True
+            continue
+
+        if add and value >= number:
+            stack.append((value - number, k - 1))
+        if mul:
+            if number == 0:
+                if value == 0:
+                    return True
+            elif value % number == 0:
+                stack.append((value // number, k - 1))
+        if concat and value % powers[k] == number:
+            stack.append((value // powers[k], k - 1))
+
+    return False
+
 def solve_equation(target: int, numbers: list[int], operations: list[Operation]) -> int:
-    numbers_len = len(numbers)
-    results = [[] for _ in range(numbers_len)]
-    results[0].append(numbers[0])
-
-    for ind, number in enumerate(numbers[1:]):
-        for result in results[ind]:
-            for operation in operations:
-                match operation:
-                    case Operation.Mul:
-                        results[ind + 1].append(result * number)
-                    case Operation.Add:
-                        results[ind + 1].append(result + number)
-                    case Operation.Concat:
-                        digit_count = math.floor(math.log10(number)) + 1
-                        results[ind + 1].append(result * math.pow(10, digit_count) + number)
-
-    if target in results[numbers_len - 1]:
-        return target
-    else:
-        return 0
+    return target if is_solvable(target, numbers, operations) else 0
 
 def solve_part_1(input: list[str]) -> int:
     ans = sum(itertools.starmap(
@@ -78,10 +96,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 1_298_300_076_754
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 248_427_118_972_289
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
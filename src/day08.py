@@ -1,24 +1,25 @@
 #!/usr/bin/env python3
 
-Grid = list[str]
+import loader
+
+ANSWERS = (222, 884)
+
+Grid = loader.GridView
+
+EMPTY = ord(".")
 
 def read_and_parse(filename: str) -> Grid:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_grid(filename)
     
 def is_valid(i: int, j: int, grid: Grid) -> bool:
-    rows = len(grid)
-    cols = len(grid[0])
-    
-    return i >= 0 and i < rows and j >= 0 and j < cols
+    return (i, j) in grid
 
 def build_antennas(grid: Grid):
     antennas = {}
 
-    for i, line in enumerate(grid):
-       for j, cell in enumerate(line):
-           if cell != ".":
-               antennas.setdefault(cell, []).append((i, j))
+    for point, cell in grid.items():
+        if cell != EMPTY:
+            antennas.setdefault(cell, []).append(point)
 
     return antennas
 
@@ -33,7 +34,7 @@ def emit(start: tuple[int], step: tuple[int], grid: Grid, antinodes: list[list[b
 
 def solve_part_1(grid: Grid):
     antennas = build_antennas(grid)
-    antinodes = [[False for _ in range(len(grid[0]))] for _ in range(len(grid))]
+    antinodes = [[False for _ in range(grid.width)] for _ in range(grid.height)]
 
     for points in antennas.values():
         for i, point_1 in enumerate(points):
@@ -49,7 +50,7 @@ def solve_part_1(grid: Grid):
 
 def solve_part_2(grid: Grid):
     antennas = build_antennas(grid)
-    antinodes = [[False for _ in range(len(grid[0]))] for _ in range(len(grid))]
+    antinodes = [[False for _ in range(grid.width)] for _ in range(grid.height)]
 
     for points in antennas.values():
         for i, point_1 in enumerate(points):
@@ -76,10 +77,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 222
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 884
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
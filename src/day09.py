@@ -2,9 +2,12 @@
 
 from collections import deque
 
+import loader
+
+ANSWERS = (6_346_871_685_398, 6_373_055_193_464)
+
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
 
 def bisect_right_deque(deque, x):
     low, high = 0, len(deque)
@@ -119,10 +122,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 6_346_871_685_398
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 6_373_055_193_464
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
@@ -2,70 +2,57 @@
 
 from typing import Optional
 
+import loader
+from grid import Grid
 
-Grid = list[list[int]]
+ANSWERS = (644, 1_366)
 
-DIRS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+TRAILHEAD = ord("0")
+SUMMIT = ord("9")
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+def read_and_parse(filename: str) -> loader.GridView:
+    return loader.read_grid(filename)
 
-def build_grid(input: list[str]) -> Grid:
-    return [[int(cell) for cell in line] for line in input]
+def build_grid(input: loader.GridView) -> Grid:
+    return Grid.from_view(input)
 
-def is_out(i: int, j: int, grid: Grid) -> bool:
-    n = len(grid)
-    m = len(grid[0])
+def find_paths(index: int, grid: Grid, final_points: Optional[set[int]] = None) -> int:
+    cur = grid[index]
 
-    return i < 0 or j < 0 or i >= n or j >= m
-
-def find_paths(i: int, j: int, grid: Grid, seen: Grid, final_points: Optional[set[tuple[int, int]]] = None) -> int:
-    seen[i][j] = True
-    cur = grid[i][j]
-
-    if cur == 9:
+    if cur == SUMMIT:
         if final_points is not None:
-            final_points.add((i, j))
+            final_points.add(index)
 
         return 1
 
     ans = 0
-    for di, dj in DIRS:
-        to_i, to_j = i + di, j + dj
+    for dir in grid.dirs:
+        to_index = index + dir
 
-        if not is_out(to_i, to_j, grid) and grid[to_i][to_j] == cur + 1:
-            ans += find_paths(to_i, to_j, grid, seen, final_points)
+        if grid[to_index] == cur + 1:
+            ans += find_paths(to_index, grid, final_points)
 
     return ans
 
-def solve_part_1(input: list[str]):
+def solve_part_1(input: loader.GridView):
     grid = build_grid(input)
-    n = len(grid)
-    m = len(grid[0])
 
     ans = 0
-    for i in range(n):
-        for j in range(m):
-            if grid[i][j] == 0:
-                seen = [[[False] * len(DIRS) for _ in range(m)] for _ in range(n)]
-                final_points = set()
-                _ = find_paths(i, j, grid, seen, final_points)
-                ans += len(final_points)
+    for index in grid.indices():
+        if grid[index] == TRAILHEAD:
+            final_points = set()
+            _ = find_paths(index, grid, final_points)
+            ans += len(final_points)
 
     return ans
 
-def solve_part_2(input: list[str]):
+def solve_part_2(input: loader.GridView):
     grid = build_grid(input)
-    n = len(grid)
-    m = len(grid[0])
 
     ans = 0
-    for i in range(n):
-        for j in range(m):
-            if grid[i][j] == 0:
-                seen = [[[False] * len(DIRS) for _ in range(m)] for _ in range(n)]
-                ans += find_paths(i, j, grid, seen)
+    for index in grid.indices():
+        if grid[index] == TRAILHEAD:
+            ans += find_paths(index, grid)
 
     return ans
 
@@ -82,10 +69,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 644
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 1_366
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
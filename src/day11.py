@@ -3,11 +3,14 @@
 import math
 import functools
 
+import loader
+
+ANSWERS = (200_446, 238_317_474_993_392)
+
 Stone = tuple[int, int]
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
 
 def next_stones(stone: int) -> list[int]:
     if stone == 0:
@@ -65,10 +68,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 200_446
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 238_317_474_993_392
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
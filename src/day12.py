@@ -3,85 +3,67 @@
 import itertools
 import collections
 
-Grid = list[list[str]]
+import loader
+from grid import Grid
+
+ANSWERS = (1_473_276, 901_100)
 
 Region = collections.namedtuple(
     "Region", ["area", "perimeter", "sides"]
 )
 
-DIRS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
-
-def is_out(i: int, j: int, grid: Grid) -> bool:
-    n = len(grid)
-    m = len(grid[0])
+def read_and_parse(filename: str) -> loader.GridView:
+    return loader.read_grid(filename)
 
-    return i < 0 or j < 0 or i >= n or j >= m
-
-def side_dirs(dir: int) -> int:
+def side_dirs(dir: int, grid: Grid) -> list[int]:
     assert dir >= 0 and dir <= 3
 
-    return [DIRS[(dir + 1) % len(DIRS)], DIRS[(dir + 3) % len(DIRS)]]
+    return [grid.dirs[(dir + 1) % len(grid.dirs)], grid.dirs[(dir + 3) % len(grid.dirs)]]
 
-def dfs(i: int, j: int, grid: Grid, seen: Grid, side_cells: set[tuple[int, int, int]]) -> Region:
-    seen[i][j] = True
+def dfs(index: int, grid: Grid, seen: bytearray, side_cells: set[tuple[int, int]]) -> Region:
+    seen[index] = True
+    plant = grid[index]
 
     area, perimeter, sides = 1, 0, 0
 
-    for dir, (di, dj) in enumerate(DIRS):
-        to_i, to_j = i + di, j + dj
-
-        if (i, j, dir) not in side_cells and (
-            is_out(to_i, to_j, grid) or grid[i][j] != grid[to_i][to_j]
-        ):
+    for dir, offset in enumerate(grid.dirs):
+        if (index, dir) not in side_cells and grid[index + offset] != plant:
             sides += 1
-            for side_di, side_dj in side_dirs(dir):
-                side_i = i
-                side_j = j
+            for side_offset in side_dirs(dir, grid):
+                side_index = index
 
-                while not is_out(side_i, side_j, grid) and grid[side_i][side_j] == grid[i][j] and (
-                    is_out(side_i + di, side_j + dj, grid) or grid[i][j] != grid[side_i + di][side_j + dj]
-                ):
-                    side_cells.add((side_i, side_j, dir))
-                    side_i += side_di
-                    side_j += side_dj
+                while grid[side_index] == plant and grid[side_index + offset] != plant:
+                    side_cells.add((side_index, dir))
+                    side_index += side_offset
 
-    for di, dj in DIRS:
-        to_i, to_j = i + di, j + dj
+    for offset in grid.dirs:
+        to_index = index + offset
 
-        if is_out(to_i, to_j, grid):
+        if grid[to_index] != plant:
             perimeter += 1
-        else:
-            if grid[i][j] != grid[to_i][to_j]:
-                perimeter += 1
-                
-            elif not seen[to_i][to_j]:
-                to_area, to_perimeter, to_sides = dfs(to_i, to_j, grid, seen, side_cells)
-                area += to_area
-                perimeter += to_perimeter
-                sides += to_sides
+        elif not seen[to_index]:
+            to_area, to_perimeter, to_sides = dfs(to_index, grid, seen, side_cells)
+            area += to_area
+            perimeter += to_perimeter
+            sides += to_sides
 
     return area, perimeter, sides
 
-def solve(grid: Grid) -> list[Region]:
-    n = len(grid)
-    m = len(grid[0])
+def solve(input: loader.GridView) -> list[Region]:
+    grid = Grid.from_view(input)
 
     side_cells = set()
-    seen = [[False for _ in range(m)] for _ in range(n)]
+    seen = bytearray(len(grid))
 
     result = list(
-        dfs(i, j, grid, seen, side_cells) 
-        for i, j in itertools.product(range(n), range(m)) 
-        if not seen[i][j]
+        dfs(index, grid, seen, side_cells) 
+        for index in grid.indices()
+        if not seen[index]
     )
 
     return result
 
-def solve_part_1(input: list[str]):
+def solve_part_1(input: loader.GridView):
     return sum(
         itertools.starmap(
             lambda area, perimeter, _: area * perimeter, 
@@ -89,7 +71,7 @@ def solve_part_1(input: list[str]):
         )
     )
 
-def solve_part_2(input: list[str]):
+def solve_part_2(input: loader.GridView):
     return sum(
         itertools.starmap(
             lambda area, _, sides: area * sides, 
@@ -110,10 +92,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 1_473_276
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 901_100
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
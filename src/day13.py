@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 
 import math
-import re
 
-re_button_a = r"Button A: X([\+|\-]\d+), Y([\+|\-]\d+)"
-re_button_b = r"Button B: X([\+|\-]\d+), Y([\+|\-]\d+)"
-re_price = r"Prize: X=(\d+), Y=(\d+)"
+import lazy
+import loader
+
+ANSWERS = (31_589, 98_080_815_200_063)
+
+re_button_a = lazy.Pattern(r"Button A: X([\+|\-]\d+), Y([\+|\-]\d+)")
+re_button_b = lazy.Pattern(r"Button B: X([\+|\-]\d+), Y([\+|\-]\d+)")
+re_price = lazy.Pattern(r"Prize: X=(\d+), Y=(\d+)")
 
 price_a = 3
 price_b = 1
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+    return loader.read_blocks(filename)
 
 def lcm(a: int, b: int) -> int:
     return abs(a * b) // math.gcd(a, b)
@@ -22,13 +25,13 @@ def solve(input: list[str], price_boost = 0) -> int:
     for game in input:
         lines = game.splitlines()
 
-        button_a = re.findall(re_button_a, lines[0])[0]
+        button_a = re_button_a.findall(lines[0])[0]
         button_a = list(map(int, button_a))
 
-        button_b = re.findall(re_button_b, lines[1])[0]
+        button_b = re_button_b.findall(lines[1])[0]
         button_b = list(map(int, button_b))
 
-        prize = re.findall(re_price, lines[2])[0]
+        prize = re_price.findall(lines[2])[0]
         prize = list(map(lambda p: int(p) + price_boost, prize))
 
         b_lcm = lcm(button_b[0], button_b[1])
@@ -86,10 +89,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 31_589
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 98_080_815_200_063
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
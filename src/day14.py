@@ -1,42 +1,37 @@
 #!/usr/bin/env python3
 
-import re
 import itertools
 
-re_robot = r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)"
+import lazy
+import loader
+from grid import Grid
 
-DIRS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-Grid = list[list[bool]]
+ANSWERS = (228690000, 7093)
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+re_robot = lazy.Pattern(r"p=(-?\d+),(-?\d+) v=(-?\d+),(-?\d+)")
 
-def is_out(i: int, j: int, grid: Grid) -> bool:
-    n = len(grid)
-    m = len(grid[0])
+ROBOT = ord("#")
 
-    return i < 0 or j < 0 or i >= n or j >= m
+def read_and_parse(filename: str) -> list[str]:
+    return loader.read_lines(filename)
 
-def dfs(i: int, j: int, grid: Grid, seen: Grid) -> int:
-    seen[i][j] = True
+def dfs(index: int, grid: Grid, seen: bytearray) -> int:
+    seen[index] = True
 
     size = 1
-    for di, dj in DIRS:
-        to_i, to_j = i + di, j + dj
+    for dir in grid.dirs:
+        to_index = index + dir
 
-        if not is_out(to_i, to_j, grid) and not seen[to_i][to_j] and grid[to_i][to_j]:
-            size += dfs(to_i, to_j, grid, seen)
+        if not seen[to_index] and grid[to_index] == ROBOT:
+            size += dfs(to_index, grid, seen)
 
     return size
 
 def solve_part_1(input: list[str], h, w, time):
-    robot_matcher = re.compile(re_robot)
-
     quadrants = [[0 for _ in range(2)] for _ in range(2)]
 
     for line in input:
-        if (match := robot_matcher.match(line)) is not None:
+        if (match := re_robot.match(line)) is not None:
             j, i, dj, di = map(int, match.groups())
 
             final_i = (i + time * di + time * h) % h
@@ -160,30 +155,25 @@ def solve_part_1(input: list[str], h, w, time):
 ...........#.........................................................................................
 '''
 def solve_part_2(input: list[str], h, w):
-    robot_matcher = re.compile(re_robot)
-
     robots = []
     for line in input:
-        if (match := robot_matcher.match(line)) is not None:
+        if (match := re_robot.match(line)) is not None:
             robots.append(list(map(int, match.groups())))
 
     for time in itertools.count():
-        grid = [[False for _ in range(w)] for _ in range(h)]
+        grid = Grid(h, w)
 
         for robot in robots:
             robot[0] = (robot[0] + robot[2] + w) % w
             robot[1] = (robot[1] + robot[3] + h) % h
 
-            grid[robot[1]][robot[0]] = True
+            grid[grid.index(robot[1], robot[0])] = ROBOT
 
-        seen = [[False for _ in range(w)] for _ in range(h)]
+        seen = bytearray(len(grid))
         max_comp_size = max(
-            itertools.starmap(lambda i, j: dfs(i, j, grid, seen), [
-                (i, j) 
-                for i in range(h) 
-                for j in range(w) 
-                if not seen[i][j] and grid[i][j]
-            ])
+            dfs(index, grid, seen)
+            for index in [grid.index(robot[1], robot[0]) for robot in robots]
+            if not seen[index]
         )
       
         if max_comp_size > 20:
@@ -203,10 +193,10 @@ def main():
     
     part_1_answer = solve_part_1(input, h = 103, w = 101, time = 100)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 228690000
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input, h = 103, w = 101)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 7093
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
@@ -4,6 +4,10 @@ import functools
 from typing import Optional
 from collections import deque
 
+import loader
+
+ANSWERS = (1_495_147, 1_524_905)
+
 @functools.total_ordering
 class Point(tuple[int, int]):
     def key(self) -> tuple[int, int]:
@@ -141,8 +145,7 @@ class Grid:
         return pushed_points
 
 def read(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+    return loader.read_blocks(filename)
 
 def parse(input: list[str]) -> tuple[Grid, list[Point]]:
     grid = Grid(input[0])
@@ -199,10 +202,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 1_495_147
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 1_524_905
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
@@ -1,60 +1,38 @@
 #!/usr/bin/env python3
 
 import collections
-import functools
-from typing import Iterable
 import heapq
 from collections import deque
 
-@functools.total_ordering
-class Point(tuple[int, int]):
-    def __new__(cls, x: int, y: int):
-        return super().__new__(cls, (x, y))
-    
-    def __add__(self, other):
-        return Point(self[0] + other[0], self[1] + other[1])
-
-    def __sub__(self, other):
-        return Point(self[0] - other[0], self[1] - other[1])
-
-    def __iadd__(self, other):
-        self = self + other
+import loader
+from grid import Grid
 
-        return self
+ANSWERS = (88_416, 442)
 
-    def __isub__(self, other):
-        self = self - other
+WALL = ord("#")
 
-        return self
-    
 DirectedPoint = collections.namedtuple(
     "DirectedPoint", ["point", "ind"]
 )
 
-class Grid:
-    DIRS = [Point(-1, 0), Point(0, 1), Point(1, 0), Point(0, -1)]
-
-    def __init__(self, input: list[str]):
-        grid = [list(line) for line in input]
-        self.grid = grid
-        self.start, self.end = self._start_and_end()
+class Maze:
+    INF = 10**9
 
-    def __getitem__(self, point: Point) -> str:
-        x = point[0]
-        y = point[1]
-    
-        return self.grid[x][y]
+    def __init__(self, input: loader.GridView):
+        self.grid = Grid.from_view(input)
+        self.start, self.end = self.grid.find(b"S"), self.grid.find(b"E")
 
+        assert self.start and self.end
 
     def find_path(self) -> tuple[int, int]:
         start = DirectedPoint(self.start, 1)
         (distance, parent) = self._dijkstra(start)
 
-        best_distance = 10**9
+        best_distance = Maze.INF
         best_end_dir_point = None
-        end_dir_points = [DirectedPoint(self.end, dir_ind) for dir_ind in range(len(Grid.DIRS))]
+        end_dir_points = [DirectedPoint(self.end, dir_ind) for dir_ind in range(len(self.grid.dirs))]
         for end_dir_point in end_dir_points:
-            if end_dir_point in distance and distance[end_dir_point] < best_distance:
+            if distance[end_dir_point] < best_distance:
                 best_distance = distance[end_dir_point]
                 best_end_dir_point = end_dir_point
 
@@ -62,14 +40,8 @@ class Grid:
 
         return (best_distance, points)
 
-    def _get_neighbors(self, point: Point) -> Iterable[Point]:
-        for dir in Grid.DIRS:
-            to_point = point + dir
-            if self.__getitem__(to_point) != "#":
-                yield to_point
-
     def _dijkstra(self, source: DirectedPoint):
-        distance = collections.defaultdict(lambda: 10**9)
+        distance = collections.defaultdict(lambda: Maze.INF)
         parent = collections.defaultdict(lambda: [])
 
         heap = []
@@ -83,19 +55,21 @@ class Grid:
             if point_distance != distance[current_dir_point]:
                 continue
 
-            for next_point in self._get_neighbors(current_dir_point.point):
-                dir = next_point - current_dir_point.point
-                dir_ind = Grid.DIRS.index(dir)
+            for dir_ind, dir in enumerate(self.grid.dirs):
+                next_point = current_dir_point.point + dir
+                if self.grid[next_point] == WALL or self.grid[next_point] == Grid.BORDER:
+                    continue
+
                 next_dir_point = DirectedPoint(next_point, dir_ind)
 
                 rotation_cost = self._calculate_rotation_cost(current_dir_point.ind, dir_ind)
-                new_distance = distance[current_dir_point] + 1 + rotation_cost
+                new_distance = point_distance + 1 + rotation_cost
 
                 if distance[next_dir_point] >= new_distance:
                     if distance[next_dir_point] > new_distance:
                         distance[next_dir_point] = new_distance
                         parent[next_dir_point] = [current_dir_point]
-                        heapq.heappush(heap, (distance[next_dir_point], next_dir_point))
+                        heapq.heappush(heap, (new_distance, next_dir_point))
                     else:
                         parent[next_dir_point].append(current_dir_point)
 
@@ -118,37 +92,23 @@ class Grid:
     def _calculate_rotation_cost(self, current_dir_ind: int, to_dir_ind: int) -> int:
         mi = min(current_dir_ind, to_dir_ind)
         ma = max(current_dir_ind, to_dir_ind)
-        rotation_cost = min(ma - mi, len(Grid.DIRS) + mi - ma)
+        rotation_cost = min(ma - mi, len(self.grid.dirs) + mi - ma)
         rotation_cost = 1000 * rotation_cost
         
         return rotation_cost
 
-    def _start_and_end(self) -> tuple[Point, Point]:
-        start, end = None, None
-        for i, row in enumerate(self.grid):
-            for j, c in enumerate(row):
-                if c == "S":
-                    start = Point(i, j)
-                elif c == "E":
-                    end = Point(i, j)
-
-        assert start and end
-
-        return start, end
-
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+def read_and_parse(filename: str) -> loader.GridView:
+    return loader.read_grid(filename)
 
-def solve_part_1(input: list[str]):
-    grid = Grid(input)
+def solve_part_1(input: loader.GridView):
+    maze = Maze(input)
 
-    return grid.find_path()[0]
+    return maze.find_path()[0]
 
-def solve_part_2(input: list[str]):
-    grid = Grid(input)
+def solve_part_2(input: loader.GridView):
+    maze = Maze(input)
 
-    return grid.find_path()[1]
+    return maze.find_path()[1]
 
 def check():
     input_small_1 = read_and_parse("assets/day16/in_small_1.txt")
@@ -170,10 +130,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 88_416
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 442
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
@@ -2,6 +2,10 @@
 
 from typing import Iterable, Optional
 
+import loader
+
+ANSWERS = ("3,5,0,1,5,1,5,1,0", 107_413_700_225_434)
+
 class Program:
     def __init__(self, registers: list[int], source: list[int]):
         self.registers = registers
@@ -63,8 +67,7 @@ class Program:
                 return self.registers[2]
 
 def read(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+    return loader.read_blocks(filename)
 
 def solve_part_1(input: list[str]):
     registers = list(
@@ -114,10 +117,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == "3,5,0,1,5,1,5,1,0"
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 107_413_700_225_434
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
@@ -2,9 +2,12 @@
 
 import functools
 
+import loader
+
+ANSWERS = (302, 771_745_460_576_799)
+
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+    return loader.read_blocks(filename)
 
 def count_ways(towel: str, patterns: list[str]) -> int:
     @functools.cache
@@ -51,10 +54,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 302
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 771_745_460_576_799
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
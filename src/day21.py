@@ -5,6 +5,10 @@ from functools import cache
 from typing import Iterable, Optional
 from itertools import permutations, pairwise
 
+import loader
+
+ANSWERS = (164_960, 205_620_604_017_764)
+
 numeric_keypad = [
     ["7", "8", "9"],
     ["4", "5", "6"],
@@ -76,9 +80,11 @@ class Grid:
 
         return list(filter(lambda result: len(result) <= best, results))
     
+DIRECTIONAL_KEYPAD = Grid(directional_keypad)
+NUMERIC_KEYPAD = Grid(numeric_keypad)
+
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
     
 def dir_to_key(dir: complex) -> str:
     match dir:
@@ -91,88 +97,85 @@ def dir_to_key(dir: complex) -> str:
         case complex(real = 0, imag = -1): 
             return "<"
 
-def solve(input: list[str], depth: int):
-    result = 0
-    
-    directional_keypad_grid = Grid(directional_keypad)
-    numeric_keypad_grid = Grid(numeric_keypad)
+@cache
+def count_moves(cur_key: str, dest_key: complex, depth = 1) -> int:
+    cur_point = DIRECTIONAL_KEYPAD.find(cur_key)
+    dest_point = DIRECTIONAL_KEYPAD.find(dest_key)
+
+    if depth == 0:
+        return int(
+            abs(cur_point.real - dest_point.real) + 
+            abs(cur_point.imag - dest_point.imag)
+        ) + 1
+
+    possible_points = []
+    for _ in range(int(cur_point.imag), int(dest_point.imag)):
+        possible_points.append(+0 + 1 * 1j)
+    for _ in range(int(dest_point.imag), int(cur_point.imag)):
+        possible_points.append(+0 - 1 * 1j)
+    for _ in range(int(cur_point.real), int(dest_point.real)):
+        possible_points.append(+1 + 0 * 1j)
+    for _ in range(int(dest_point.real), int(cur_point.real)):
+        possible_points.append(-1 + 0 * 1j)
+
+    if not possible_points:
+        return 1
+
+    best = 10**20
+    for points in permutations(possible_points):
+        cur = cur_point
+        steps = count_moves("A", dir_to_key(points[0]), depth - 1)
+
+        for from_point, to_point in pairwise(points):
+            steps += count_moves(dir_to_key(from_point), dir_to_key(to_point), depth - 1)
+            cur += from_point
+            if cur == 0 + 0 * 1j:
+                break
+        else:
+            steps += count_moves(dir_to_key(points[-1]), "A", depth - 1)
+            best = min(best, steps)
+
+    return best
+
+@cache
+def solve_numeric_keypad(grid: Grid, input: str) -> list[list[complex]]:
+    cur_num_key = grid.find("A")
+    numeric_pathes: list[list[complex]] = [[]]
+
+    for num_key in input:
+        num_key = grid.find(num_key)
+        pathes = grid.paths(cur_num_key, num_key)
+        numeric_pathes_upd = []
+        for points in pathes:
+            keys = []
+            for from_point, to_point in pairwise(points):
+                dir = to_point - from_point
+                keys.append(dir_to_key(dir))
 
-    @cache
-    def count_moves(cur_key: str, dest_key: complex, depth = 1) -> int:
-        cur_point = directional_keypad_grid.find(cur_key)
-        dest_point = directional_keypad_grid.find(dest_key)
-
-        if depth == 0:
-            return int(
-                abs(cur_point.real - dest_point.real) + 
-                abs(cur_point.imag - dest_point.imag)
-            ) + 1
-
-        possible_points = []
-        for _ in range(int(cur_point.imag), int(dest_point.imag)):
-            possible_points.append(+0 + 1 * 1j)
-        for _ in range(int(dest_point.imag), int(cur_point.imag)):
-            possible_points.append(+0 - 1 * 1j)
-        for _ in range(int(cur_point.real), int(dest_point.real)):
-            possible_points.append(+1 + 0 * 1j)
-        for _ in range(int(dest_point.real), int(cur_point.real)):
-            possible_points.append(-1 + 0 * 1j)
-        
-        if not possible_points:
-            return 1
-        
-        best = 10**20
-        for points in permutations(possible_points):
-            cur = cur_point
-            steps = count_moves("A", dir_to_key(points[0]), depth - 1)
+            for path in numeric_pathes:
+                numeric_pathes_upd.append(copy(path) + keys + ["A"])
+        numeric_pathes = numeric_pathes_upd
+        cur_num_key = num_key
 
-            for from_point, to_point in pairwise(points):
-                steps += count_moves(dir_to_key(from_point), dir_to_key(to_point), depth - 1)
-                cur += from_point
-                if cur == 0 + 0 * 1j:
-                    break
-            else:
-                steps += count_moves(dir_to_key(points[-1]), "A", depth - 1)
-                best = min(best, steps)
-
-        return best
-    
-    def solve_numeric_keypad(grid: Grid, input: list[str]) -> list[list[complex]]:
-        cur_num_key = grid.find("A")
-        numeric_pathes: list[list[complex]] = [[]]
-
-        for num_key in input:
-            num_key = grid.find(num_key)
-            pathes = grid.paths(cur_num_key, num_key)
-            numeric_pathes_upd = []
-            for points in pathes:
-                keys = []
-                for from_point, to_point in pairwise(points):
-                    dir = to_point - from_point
-                    keys.append(dir_to_key(dir))
-            
-                for path in numeric_pathes:
-                    numeric_pathes_upd.append(copy(path) + keys + ["A"])
-            numeric_pathes = numeric_pathes_upd
-            cur_num_key = num_key
+    return numeric_pathes
 
-        return numeric_pathes
+@cache
+def code_complexity(code: str, depth: int) -> int:
+    numeric_pathes = solve_numeric_keypad(NUMERIC_KEYPAD, code)
 
-    for code in input:
-        numeric_pathes = solve_numeric_keypad(numeric_keypad_grid, code)
+    ans = 10**20
+    for numeric_path in numeric_pathes:
+        path = ["A"] + numeric_path
+        
+        ans = min(ans, sum(
+            count_moves(from_point, to_point, depth) 
+            for from_point, to_point in pairwise(path)
+        ))
 
-        ans = 10**20
-        for numeric_path in numeric_pathes:
-            path = ["A"] + numeric_path
-            
-            ans = min(ans, sum(
-                count_moves(from_point, to_point, depth) 
-                for from_point, to_point in pairwise(path)
-            ))
- 
-        result += ans * int(code[:3])
+    return ans * int(code[:3])
 
-    return result
+def solve(input: list[str], depth: int):
+    return sum(code_complexity(code, depth) for code in input)
 
 def check():
     input_small = read_and_parse("assets/day21/in_small.txt")
@@ -187,10 +190,10 @@ def main():
     
     part_1_answer = solve(input, depth = 1)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 164_960
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve(input, depth = 24)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 205_620_604_017_764
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
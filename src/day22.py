@@ -3,11 +3,14 @@
 from typing import Optional
 from collections import defaultdict
 
+import loader
+
+ANSWERS = (16_999_668_565, 1_898)
+
 Sequence = tuple[int, int, int, int]
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
 
 def window_iterate(list, window_size):
     for i in range(len(list) - window_size + 1):
@@ -67,10 +70,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 16_999_668_565
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == 1_898
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
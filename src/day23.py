@@ -2,6 +2,10 @@
 
 from collections import defaultdict
 
+import loader
+
+ANSWERS = (1_119, "av,fr,gj,hk,ii,je,jo,lq,ny,qd,uq,wq,xc")
+
 class Graph:
     def __init__(self, input: list[str]):
         adj = defaultdict(list)
@@ -23,8 +27,7 @@ class Graph:
         self.connected = connected
 
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().splitlines()
+    return loader.read_lines(filename)
     
 def solve_part_1(input: list[str]):
     graph = Graph(input)
@@ -84,10 +87,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 1_119
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == "av,fr,gj,hk,ii,je,jo,lq,ny,qd,uq,wq,xc"
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()    
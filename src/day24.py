@@ -1,18 +1,26 @@
 #!/usr/bin/env python3
 
 import functools
-from enum import Enum
-from typing import Iterable
+from collections.abc import Iterable
 from collections import deque, defaultdict
 
-class Operation(Enum):
+import cache
+import loader
+
+ANSWERS = (55_114_892_239_566, "cdj,dhm,gfm,mrb,qjd,z08,z16,z32")
+
+class Operation:
     AND = 1
     XOR = 2
     OR = 3
 
-def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+Circuit = tuple[
+    dict[str, int], 
+    dict[tuple[str, str], list[tuple[Operation, str]]]
+]
+
+def read_and_parse(filename: str) -> Circuit:
+    return cache.parsed(filename, parse)
 
 def get_num(start: str, wires: dict[str, int]) -> int:
     interested = [wire for wire in wires.items() if wire[0].startswith(start)]
@@ -25,10 +33,8 @@ def get_num(start: str, wires: dict[str, int]) -> int:
     
     return number[0]
 
-def solve(input: list[str]) -> tuple[
-    dict[str, int], 
-    dict[tuple[str, str], list[tuple[Operation, str]]]
-]:
+def parse(filename: str) -> Circuit:
+    input = loader.read_blocks(filename)
     wires = dict()
 
     for initial in input[0].splitlines():
@@ -61,6 +67,12 @@ def solve(input: list[str]) -> tuple[
                 rules_[(first, second)].append((Operation.OR, output))
                 rules_[(second, first)].append((Operation.OR, output))
 
+    return wires, rules_
+
+def solve(circuit: Circuit) -> Circuit:
+    wires, rules_ = circuit
+    wires = dict(wires)
+
     q = deque(wire for wire in wires.items() if wire[1] is not None)
     while q:
         wire_1, value = q.popleft()
@@ -133,12 +145,12 @@ def SHITTTY_part_2_solve(rules: dict[tuple[str, str], list[tuple[Operation, str]
         
         bit += 1
 
-def solve_part_1(input: list[str]):
+def solve_part_1(input: Circuit):
     (wires, _) = solve(input)
 
     return get_num("z", wires)
 
-def solve_part_2(input: list[str]):
+def solve_part_2(input: Circuit):
     (_, rules) = solve(input)
 
     return ",".join(sorted(SHITTTY_part_2_solve(rules)))
@@ -157,10 +169,10 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 55_114_892_239_566
+    assert part_1_answer == ANSWERS[0]
     part_2_answer = solve_part_2(input)
     print(f"Part 2: {part_2_answer}")
-    assert part_2_answer == "cdj,dhm,gfm,mrb,qjd,z08,z16,z32"
+    assert part_2_answer == ANSWERS[1]
 
 if __name__ == "__main__":
     check()
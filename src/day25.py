@@ -2,9 +2,12 @@
 
 from itertools import product
 
+import loader
+
+ANSWERS = (3_439,)
+
 def read_and_parse(filename: str) -> list[str]:
-    with open(filename, "r", encoding="utf-8") as file:
-        return file.read().split("\n\n")
+    return loader.read_blocks(filename)
 
 def solve_part_1(input: list[str]):
     locks = []
@@ -44,7 +47,7 @@ def main():
     
     part_1_answer = solve_part_1(input)
     print(f"Part 1: {part_1_answer}")
-    assert part_1_answer == 3_439
+    assert part_1_answer == ANSWERS[0]
 
 if __name__ == "__main__":
     check()
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+
+''' Seeded generators of valid, arbitrarily large inputs for every day
+
+    `size` is the natural scale of each puzzle: lines or records for list inputs,
+    the side of the grid for grid inputs, bits for day 24. A generator returns the
+    input text and the solver arguments that depend on it (grid sizes for days 14
+    and 18), which `puzzles.solve` accepts as `params`.
+'''
+
+import argparse
+import collections
+import os
+import random
+import string
+
+import puzzles
+
+GENERATED_DIR = os.path.join(".cache", "generated")
+
+Generated = collections.namedtuple(
+    "Generated", ["text", "params"], defaults = [{}]
+)
+
+def maze(rng: random.Random, size: int, extra_openings: float = 0.0) -> list[list[str]]:
+    ''' Randomized depth-first maze on odd cells, walls everywhere else '''
+    size = max(5, size | 1)
+    cells = [["#"] * size for _ in range(size)]
+
+    stack = [(size - 2, 1)]
+    cells[size - 2][1] = "."
+    while stack:
+        i, j = stack[-1]
+        neighbors = [
+            (i + di, j + dj)
+            for di, dj in [(-2, 0), (0, 2), (2, 0), (0, -2)]
+            if 0 < i + di < size - 1 and 0 < j + dj < size - 1 and cells[i + di][j + dj] == "#"
+        ]
+        if not neighbors:
+            stack.pop()
+            continue
+
+        to_i, to_j = rng.choice(neighbors)
+        cells[(i + to_i) // 2][(j + to_j) // 2] = "."
+        cells[to_i][to_j] = "."
+        stack.append((to_i, to_j))
+
+    for i in range(1, size - 1):
+        for j in range(1, size - 1):
+            if cells[i][j] == "#" and (i + j) % 2 and rng.random() < extra_openings:
+                cells[i][j] = "."
+
+    return cells
+
+def names(rng: random.Random, count: int, length: int = 2, first: str = string.ascii_lowercase) -> list[str]:
+    ''' `count` distinct lowercase names, longer than `length` only when it runs out '''
+    while len(first) * 26 ** (length - 1) < 2 * count:
+        length += 1
+
+    unique = set()
+    while len(unique) < count:
+        unique.add(rng.choice(first) + "".join(rng.choices(string.ascii_lowercase, k = length - 1)))
+
+    return sorted(unique)
+
+def generate_day01(rng: random.Random, size: int) -> Generated:
+    values = [rng.randint(10_000, 99_999) for _ in range(max(1, size // 4))]
+
+    return Generated("\n".join(
+        f"{rng.randint(10_000, 99_999)}   {rng.choice(values)}"
+        for _ in range(size)
+    ))
+
+def generate_day02(rng: random.Random, size: int) -> Generated:
+    reports = []
+    for _ in range(size):
+        sign = rng.choice([-1, 1])
+        level = [rng.randint(20, 80)]
+        for _ in range(rng.randint(4, 7)):
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-2, 5)
+            level.append(level[-1] + sign * step)
+        reports.append(" ".join(map(str, level)))
+
+    return Generated("\n".join(reports))
+
+def generate_day03(rng: random.Random, size: int) -> Generated:
+    junk = list("!@#$%^&*()[]{}<>?,'~ ") + ["mul(", "do(", "don't", "mul[", "mul ( 2,4)", "why()", "from()"]
+
+    tokens = []
+    for _ in range(size):
+        match rng.choices(["mul", "do", "don't", "junk"], [6, 1, 1, 4])[0]:
+            case "mul":
+                tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            case "do":
+                tokens.append("do()")
+            case "don't":
+                tokens.append("don't()")
+            case "junk":
+                tokens.append("".join(rng.choices(junk, k = rng.randint(1, 4))))
+
+    lines = ["".join(tokens[start:start + 500]) for start in range(0, len(tokens), 500)]
+
+    return Generated("\n".join(lines))
+
+def generate_day04(rng: random.Random, size: int) -> Generated:
+    return Generated("\n".join(
+        "".join(rng.choices("XMAS", k = size))
+        for _ in range(size)
+    ))
+
+def generate_day05(rng: random.Random, size: int) -> Generated:
+    pages = rng.sample(range(10, 100), 49)
+    rules = [
+        f"{pages[i]}|{pages[j]}"
+        for i in range(len(pages))
+        for j in range(i + 1, len(pages))
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key = pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return Generated("\n".join(rules) + "\n\n" + "\n".join(updates))
+
+def generate_day06(rng: random.Random, size: int) -> Generated:
+    ''' An outward spiral of obstacles from the middle, so the guard walks a path
+        of about size^2 / gap cells before leaving, plus noise off that path
+
+        Arms are `gap` >= 2 apart, so the obstacle ending one arm never lies on a
+        later one. Uniform noise alone lets the guard walk off in a few dozen steps.
+    '''
+    cells = [["." for _ in range(size)] for _ in range(size)]
+    gap = rng.randrange(2, 5)
+    dirs = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+    i = j = size // 2
+    cells[i][j] = "^"
+    path = {(i, j)}
+
+    turn = 0
+    while True:
+        di, dj = dirs[turn % 4]
+        for _ in range((turn // 2 + 1) * gap):
+            i, j = i + di, j + dj
+            if not (0 <= i < size and 0 <= j < size):
+                break
+            path.add((i, j))
+        else:
+            if 0 <= i + di < size and 0 <= j + dj < size:
+                cells[i + di][j + dj] = "#"
+                turn += 1
+                continue
+        break
+
+    for i in range(size):
+        for j in range(size):
+            if (i, j) not in path and cells[i][j] == "." and rng.random() < 0.02:
+                cells[i][j] = "#"
+
+    return Generated("\n".join(map("".join, cells)))
+
+def generate_day07(rng: random.Random, size: int) -> Generated:
+    equations = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(3, 12))]
+
+        target = numbers[0]
+        for number in numbers[1:]:
+            match rng.choice(["+", "*", "||"]):
+                case "+":
+                    target += number
+                case "*":
+                    target *= number
+                case "||":
+                    target = int(f"{target}{number}")
+        if rng.random() < 0.3:
+            target += 1
+
+        equations.append(f"{target}: {' '.join(map(str, numbers))}")
+
+    return Generated("\n".join(equations))
+
+def generate_day08(rng: random.Random, size: int) -> Generated:
+    frequencies = string.digits + string.ascii_letters
+    cells = [["."] * size for _ in range(size)]
+    for _ in range(size * size // 40):
+        cells[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+
+    return Generated("\n".join(map("".join, cells)))
+
+def generate_day09(rng: random.Random, size: int) -> Generated:
+    return Generated("".join(
+        str(rng.randint(1, 9) if ind % 2 == 0 else rng.randint(0, 9))
+        for ind in range(size | 1)
+    ))
+
+def generate_day10(rng: random.Random, size: int) -> Generated:
+    ''' Hills around random summits, height dropping by one per step away from the nearest '''
+    height = [[-1] * size for _ in range(size)]
+    queue = collections.deque()
+    for _ in range(max(1, size * size // 60)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        height[i][j] = 9
+        queue.append((i, j))
+
+    while queue:
+        i, j = queue.popleft()
+        for to_i, to_j in [(i - 1, j), (i, j + 1), (i + 1, j), (i, j - 1)]:
+            if 0 <= to_i < size and 0 <= to_j < size and height[to_i][to_j] < 0:
+                height[to_i][to_j] = max(0, height[i][j] - 1)
+                queue.append((to_i, to_j))
+
+    return Generated("\n".join(
+        "".join(str(cell) for cell in row)
+        for row in height
+    ))
+
+def generate_day11(rng: random.Random, size: int) -> Generated:
+    return Generated(" ".join(str(rng.randint(0, 10**6)) for _ in range(size)))
+
+def generate_day12(rng: random.Random, size: int) -> Generated:
+    ''' Random rectangular patches, so regions have real sides '''
+    cells = [[rng.choice(string.ascii_uppercase) for _ in range(size)] for _ in range(size)]
+    for _ in range(size * size // 16):
+        i, j = rng.randrange(size), rng.randrange(size)
+        h, w = rng.randint(1, 6), rng.randint(1, 6)
+        plant = rng.choice(string.ascii_uppercase)
+        for row in cells[i:i + h]:
+            row[j:j + w] = [plant] * len(row[j:j + w])
+
+    return Generated("\n".join(map("".join, cells)))
+
+def generate_day13(rng: random.Random, size: int) -> Generated:
+    machines = []
+    while len(machines) < size:
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if ax * by == ay * bx:
+            continue
+
+        pressed_a, pressed_b = rng.randint(0, 100), rng.randint(0, 100)
+        prize_x = ax * pressed_a + bx * pressed_b + rng.choice([0, 0, rng.randint(1, 50)])
+        prize_y = ay * pressed_a + by * pressed_b
+
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={prize_x}, Y={prize_y}"
+        )
+
+    return Generated("\n\n".join(machines))
+
+def generate_day14(rng: random.Random, size: int, h: int = 103, w: int = 101) -> Generated:
+    ''' A filled 5x6 block appears at a random second, which is what part 2 looks for
+
+        Part 2 is only meaningful at puzzle-like robot counts; the denser the floor,
+        the sooner random robots form a component of that size on their own.
+    '''
+    time = rng.randint(100, h * w - 1)
+    block = [(h // 2 + i, w // 2 + j) for i in range(5) for j in range(6)]
+
+    robots = []
+    for ind in range(max(size, len(block))):
+        vi, vj = rng.randint(-h + 1, h - 1), rng.randint(-w + 1, w - 1)
+        if ind < len(block):
+            i, j = block[ind]
+            i, j = (i - time * vi) % h, (j - time * vj) % w
+        else:
+            i, j = rng.randrange(h), rng.randrange(w)
+        robots.append(f"p={j},{i} v={vj},{vi}")
+    rng.shuffle(robots)
+
+    return Generated("\n".join(robots), {"h": h, "w": w})
+
+def generate_day15(rng: random.Random, size: int) -> Generated:
+    size = max(size, 5)
+    cells = [
+        [
+            "#" if i in (0, size - 1) or j in (0, size - 1) else
+            rng.choices("#O.", [1, 3, 6])[0]
+            for j in range(size)
+        ]
+        for i in range(size)
+    ]
+    cells[rng.randint(1, size - 2)][rng.randint(1, size - 2)] = "@"
+
+    moves = "".join(rng.choices("^>v<", k = 8 * size * size))
+    lines = [moves[start:start + 1000] for start in range(0, len(moves), 1000)]
+
+    return Generated("\n".join(map("".join, cells)) + "\n\n" + "\n".join(lines))
+
+def generate_day16(rng: random.Random, size: int) -> Generated:
+    cells = maze(rng, size, extra_openings = 0.1)
+    cells[len(cells) - 2][1] = "S"
+    cells[1][len(cells) - 2] = "E"
+
+    return Generated("\n".join(map("".join, cells)))
+
+def generate_day17(rng: random.Random, size: int) -> Generated:
+    ''' Register A has `size` octal digits, so part 1 prints `size` numbers
+
+        The program has the usual shape of the puzzle: shift A by three bits per
+        loop and print a mix of its low bits. Constants are redrawn until part 2
+        has a solution.
+    '''
+    day17 = puzzles.load_module(17)
+
+    while True:
+        a, b = rng.randrange(8), rng.randrange(8)
+        program = f"2,4,1,{a},7,5,1,{b},4,{rng.randrange(8)},5,5,0,3,3,0"
+        register = rng.randrange(8 ** (size - 1), 8 ** size) if size > 1 else rng.randrange(1, 8)
+        text = f"Register A: {register}\nRegister B: 0\nRegister C: 0\n\nProgram: {program}"
+
+        try:
+            day17.solve_part_2(text.split("\n\n"))
+        except ValueError:
+            continue
+
+        return Generated(text)
+
+def generate_day18(rng: random.Random, size: int) -> Generated:
+    ''' Bytes fall on every cell but the corners, so the exit is cut off eventually '''
+    size = max(size, 3)
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    cells.remove((0, 0))
+    cells.remove((size - 1, size - 1))
+    rng.shuffle(cells)
+
+    return Generated(
+        "\n".join(f"{x},{y}" for x, y in cells),
+        {"count": size * size // 5, "width": size, "height": size}
+    )
+
+def generate_day19(rng: random.Random, size: int) -> Generated:
+    patterns = sorted({
+        "".join(rng.choices("wubrg", k = rng.randint(1, 8)))
+        for _ in range(400)
+    } - set("wubrg") | set("wubr"))
+
+    towels = []
+    for _ in range(size):
+        towel = "".join(rng.choice(patterns) for _ in range(rng.randint(5, 15)))
+        if rng.random() < 0.3:
+            towel += "g" * rng.randint(1, 3)
+        towels.append(towel[:60])
+
+    return Generated(", ".join(patterns) + "\n\n" + "\n".join(towels))
+
+def generate_day20(rng: random.Random, size: int) -> Generated:
+    cells = maze(rng, size)
+    cells[len(cells) - 2][1] = "S"
+    cells[1][len(cells) - 2] = "E"
+
+    return Generated("\n".join(map("".join, cells)))
+
+def generate_day21(rng: random.Random, size: int) -> Generated:
+    return Generated("\n".join(
+        "".join(rng.choices(string.digits, k = 3)) + "A"
+        for _ in range(size)
+    ))
+
+def generate_day22(rng: random.Random, size: int) -> Generated:
+    return Generated("\n".join(str(rng.randint(1, 16_777_215)) for _ in range(size)))
+
+def generate_day23(rng: random.Random, size: int) -> Generated:
+    ''' Sparse random LAN with one planted 13-computer party '''
+    computers = names(rng, max(size, 14))
+
+    edges = set()
+    for computer in computers:
+        for other in rng.sample(computers, 6):
+            if other != computer:
+                edges.add(tuple(sorted((computer, other))))
+
+    party = computers[:13]
+    for ind, computer in enumerate(party):
+        for other in party[ind + 1:]:
+            edges.add(tuple(sorted((computer, other))))
+
+    edges = [f"{u}-{v}" if rng.random() < 0.5 else f"{v}-{u}" for u, v in edges]
+    rng.shuffle(edges)
+
+    return Generated("\n".join(edges))
+
+def generate_day24(rng: random.Random, size: int) -> Generated:
+    ''' A correct `size`-bit ripple-carry adder, so part 2 finds no swaps at 45 bits '''
+    digits = max(2, len(str(size)))
+    wires = iter(names(rng, 5 * size, length = 3, first = "abcdefghijklmnopqrstuvw"))
+
+    def wire(prefix: str, bit: int) -> str:
+        return f"{prefix}{bit:0{digits}d}"
+
+    gates = []
+    carry = None
+    for bit in range(size):
+        x, y = wire("x", bit), wire("y", bit)
+        output = wire("z", bit)
+
+        if bit == 0:
+            carry = wire("z", size) if size == 1 else next(wires)
+            gates.append((x, "XOR", y, output))
+            gates.append((x, "AND", y, carry))
+            continue
+
+        half_sum, half_carry, carry_through = next(wires), next(wires), next(wires)
+        next_carry = wire("z", size) if bit == size - 1 else next(wires)
+
+        gates.append((x, "XOR", y, half_sum))
+        gates.append((x, "AND", y, half_carry))
+        gates.append((half_sum, "XOR", carry, output))
+        gates.append((half_sum, "AND", carry, carry_through))
+        gates.append((half_carry, "OR", carry_through, next_carry))
+        carry = next_carry
+
+    gates = [
+        f"{second} {op} {first} -> {output}" if rng.random() < 0.5 else f"{first} {op} {second} -> {output}"
+        for first, op, second, output in gates
+    ]
+    rng.shuffle(gates)
+
+    initial = [
+        f"{wire(prefix, bit)}: {rng.randint(0, 1)}"
+        for prefix in "xy"
+        for bit in range(size)
+    ]
+
+    return Generated("\n".join(initial) + "\n\n" + "\n".join(gates))
+
+def generate_day25(rng: random.Random, size: int) -> Generated:
+    schemes = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [
+            "".join("#" if height >= row else "." for height in heights)
+            for row in range(6)
+        ] + ["....."]
+        if rng.random() < 0.5:
+            rows.reverse()
+        schemes.append("\n".join(rows))
+
+    return Generated("\n\n".join(schemes))
+
+GENERATORS = {
+    day: globals()[f"generate_day{day:02d}"]
+    for day in range(1, 26)
+}
+
+def generate(day: int, size: int, seed: int = 0) -> Generated:
+    return GENERATORS[day](random.Random(f"{day}-{size}-{seed}"), size)
+
+def write(day: int, size: int, seed: int = 0, directory: str = GENERATED_DIR) -> tuple[str, dict]:
+    generated = generate(day, size, seed)
+    filename = os.path.join(directory, f"{puzzles.module_name(day)}-{size}-{seed}.txt")
+
+    os.makedirs(directory, exist_ok = True)
+    with open(filename, "w", encoding="utf-8") as file:
+        file.write(generated.text)
+
+    return filename, generated.params
+
+def load(day: int, size: int, seed: int = 0) -> tuple[object, dict]:
+    filename, params = write(day, size, seed)
+
+    return puzzles.load_input(day, filename), params
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = "Generate a large input for a day")
+    parser.add_argument("day", type = int)
+    parser.add_argument("size", type = int)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--output", help = "file to write, stdout when omitted")
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    generated = generate(args.day, args.size, args.seed)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(generated.text)
+    else:
+        print(generated.text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from collections.abc import Iterable
+
+import loader
+
+class Grid:
+    ''' Flat byte grid surrounded by a one cell sentinel border
+
+        A cell is addressed by a single int index, its neighbours are `index + dir`
+        for `dir` in `dirs` (up, right, down, left), and stepping off the grid lands
+        on a `BORDER` cell, so walks need no bounds checks.
+    '''
+    BORDER = 0
+
+    def __init__(self, height: int, width: int, fill: bytes = b"."):
+        self.height = height
+        self.width = width
+        self.stride = width + 2
+        self.cells = bytearray(self.stride * (height + 2))
+        self.dirs = (-self.stride, 1, self.stride, -1)
+
+        row = fill * width
+        for i in range(height):
+            start = self.index(i, 0)
+            self.cells[start:start + width] = row
+
+    @classmethod
+    def from_view(cls, view: loader.GridView) -> "Grid":
+        ''' Rows sliced straight out of a mapped input, nothing is decoded '''
+        grid = cls(view.height, view.width)
+
+        for i in range(view.height):
+            start = grid.index(i, 0)
+            grid.cells[start:start + grid.width] = view.buffer[i * view.stride:i * view.stride + view.width]
+
+        return grid
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        assert self.cells[index] != Grid.BORDER
+
+        self.cells[index] = value
+
+    def index(self, i: int, j: int) -> int:
+        return (i + 1) * self.stride + j + 1
+
+    def point(self, index: int) -> tuple[int, int]:
+        i, j = divmod(index, self.stride)
+
+        return i - 1, j - 1
+
+    def indices(self) -> Iterable[int]:
+        for i in range(self.height):
+            start = self.index(i, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, value: bytes) -> int | None:
+        index = self.cells.find(value)
+
+        return index if index >= 0 else None
@@ -0,0 +1,24 @@
+class Pattern:
+    ''' Regular expression compiled on first use
+
+        `re` (and the `enum` it pulls in) is only imported then too, so a day
+        module defining its patterns at the top level imports in no time.
+    '''
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+        self.compiled = None
+
+    def __getattr__(self, name: str):
+        if self.compiled is None:
+            import re
+
+            self.compiled = re.compile(self.pattern, self.flags)
+
+        return getattr(self.compiled, name)
+
+def numpy_available() -> bool:
+    ''' Whether the optional NumPy paths can run, without paying for importing it '''
+    import importlib.util
+
+    return importlib.util.find_spec("numpy") is not None
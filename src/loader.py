@@ -0,0 +1,71 @@
+import mmap
+import os
+from collections.abc import Iterable
+
+class GridView:
+    ''' Rectangular grid indexed straight from the input buffer
+
+        Cells are bytes, so `grid[i, j]` is an int (compare with `ord("#")`).
+        Nothing is copied: row `i` starts at `i * stride` of the buffer.
+    '''
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+        width = buffer.find(b"\n")
+        if width < 0:
+            width = len(buffer)
+        newline = 1 if width < len(buffer) else 0
+        if width and buffer[width - 1:width] == b"\r":
+            width -= 1
+            newline += 1
+
+        self.width = width
+        self.stride = width + newline
+        self.height = (len(buffer) + newline) // self.stride if self.stride else 0
+
+    def __contains__(self, point: tuple[int, int]) -> bool:
+        i, j = point
+
+        return 0 <= i < self.height and 0 <= j < self.width
+
+    def __getitem__(self, point: tuple[int, int]) -> int:
+        i, j = point
+
+        return self.buffer[i * self.stride + j]
+
+    def items(self) -> Iterable[tuple[tuple[int, int], int]]:
+        for i in range(self.height):
+            start = i * self.stride
+            for j in range(self.width):
+                yield (i, j), self.buffer[start + j]
+
+class Input:
+    ''' Memory-mapped input file
+
+        Only grids are read without a copy, through `grid()`. The line and block
+        readers decode the whole file once, the solvers they feed want `str`.
+    '''
+    def __init__(self, filename: str):
+        with open(filename, "rb") as file:
+            if os.fstat(file.fileno()).st_size:
+                self.buffer = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+            else:
+                self.buffer = b""
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def grid(self) -> GridView:
+        return GridView(self.buffer)
+
+    def text(self) -> str:
+        return str(self.buffer, "utf-8")
+
+def read_lines(filename: str) -> list[str]:
+    return Input(filename).text().splitlines()
+
+def read_blocks(filename: str) -> list[str]:
+    return Input(filename).text().split("\n\n")
+
+def read_grid(filename: str) -> GridView:
+    return Input(filename).grid()
@@ -0,0 +1,111 @@
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+PROFILE_DIR = os.path.join(".cache", "profiles")
+
+# The runner's own modules, whose allocations are no part of the solver's
+RUNNER = [os.path.join(os.path.dirname(__file__), name) for name in ("run.py", "puzzles.py", "profiling.py")]
+
+class PeakSnapshots:
+    ''' Call hook keeping a tracemalloc snapshot from near the peak of traced memory
+
+        Checked on every Python call, a snapshot is only taken once the traced
+        memory grew `growth` times past the one already kept, so a run takes a
+        logarithmic number of them and the kept one is within `growth` of the peak.
+    '''
+    def __init__(self, growth: float = 1.1):
+        self.growth = growth
+        self.size = 0
+        self.snapshot = None
+
+    def __call__(self, frame, event, arg):
+        if (size := tracemalloc.get_traced_memory()[0]) > self.size * self.growth:
+            self.size = size
+            self.snapshot = tracemalloc.take_snapshot()
+
+        # No local trace function, so only calls reach the hook
+        return None
+
+def hot_functions(profiler: cProfile.Profile, top: int) -> list[dict]:
+    stats = pstats.Stats(profiler).stats
+    ordered = sorted(stats.items(), key = lambda item: item[1][2], reverse = True)
+
+    return [
+        {
+            "function": f"{os.path.basename(filename)}:{line}({name})",
+            "calls": calls,
+            "own": own,
+            "cumulative": cumulative,
+        }
+        for (filename, line, name), (_, calls, own, cumulative, _) in ordered[:top]
+    ]
+
+def allocation_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[dict]:
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen *>"),
+        *(tracemalloc.Filter(False, filename) for filename in RUNNER),
+    ])
+
+    return [
+        {
+            "site": f"{os.path.basename(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+def profile(name: str, func: Callable, top: int = 10, directory: str = PROFILE_DIR):
+    ''' Runs `func` under cProfile and tracemalloc, prints a summary and dumps
+        `<name>.prof` (pstats) and `<name>.json` into `directory`
+
+        Allocation sites are the ones holding memory near its peak, taken by a
+        `PeakSnapshots` hook on Python calls (`sys.settrace`, cProfile holds the
+        profile hook), so transient allocations show up as well.
+    '''
+    profiler = cProfile.Profile()
+    peaks = PeakSnapshots()
+    previous_trace = sys.gettrace()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    sys.settrace(peaks)
+    profiler.enable()
+    try:
+        result = func()
+    finally:
+        profiler.disable()
+        sys.settrace(previous_trace)
+        elapsed = time.perf_counter() - start
+        # Memory may have kept growing after the last call
+        peaks(None, "return", None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    report = {
+        "name": name,
+        "elapsed": elapsed,
+        "peak": peak,
+        "hot": hot_functions(profiler, top),
+        "allocations": allocation_sites(peaks.snapshot, top),
+    }
+
+    os.makedirs(directory, exist_ok = True)
+    profiler.dump_stats(os.path.join(directory, f"{name}.prof"))
+    with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as file:
+        json.dump(report, file, indent = 2)
+
+    print(f"{name}: {elapsed * 1000:.1f} ms profiled, peak memory {peak / 1024:.1f} KiB")
+    for hot in report["hot"]:
+        print(f"    {hot['own'] * 1000:>10.1f} ms own {hot['cumulative'] * 1000:>10.1f} ms cum {hot['calls']:>10} calls  {hot['function']}")
+    for allocation in report["allocations"]:
+        print(f"    {allocation['size'] / 1024:>10.1f} KiB at peak {allocation['count']:>10} blocks  {allocation['site']}")
+
+    return result
@@ -0,0 +1,142 @@
+import collections
+import importlib
+
+# Expected answers live in each day's module as `ANSWERS`, next to the `main()` asserting them
+Part = collections.namedtuple(
+    "Part", ["solve"]
+)
+
+Puzzle = collections.namedtuple(
+    "Puzzle", ["parts", "read"], defaults = [lambda day, filename: day.read_and_parse(filename)]
+)
+
+def read(day, filename: str):
+    return day.read(filename)
+
+PUZZLES = {
+    1: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    2: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    3: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    4: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    5: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    6: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    7: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    8: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    9: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    10: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    11: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    12: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    13: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    14: Puzzle([
+        Part(lambda day, input, h = 103, w = 101: day.solve_part_1(input, h = h, w = w, time = 100)),
+        Part(lambda day, input, h = 103, w = 101: day.solve_part_2(input, h = h, w = w)),
+    ]),
+    15: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ], read),
+    16: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    17: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ], read),
+    18: Puzzle([
+        Part(lambda day, input, count = 1024, width = 71, height = 71: day.solve_part_1(input, count = count, width = width, height = height)),
+        # Part 2 drops bytes until the exit is cut off, so the generator's `count` is ignored
+        Part(lambda day, input, width = 71, height = 71, **_: day.solve_part_2(input, width = width, height = height)),
+    ]),
+    19: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    20: Puzzle([
+        Part(lambda day, input: day.solve(input, cheat_dist = 2, wanna_cheat_at_least = 100)),
+        Part(lambda day, input: day.solve(input, cheat_dist = 20, wanna_cheat_at_least = 100)),
+    ]),
+    21: Puzzle([
+        Part(lambda day, input: day.solve(input, depth = 1)),
+        Part(lambda day, input: day.solve(input, depth = 24)),
+    ]),
+    22: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    23: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    24: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+        Part(lambda day, input: day.solve_part_2(input)),
+    ]),
+    25: Puzzle([
+        Part(lambda day, input: day.solve_part_1(input)),
+    ]),
+}
+
+def module_name(day: int) -> str:
+    return f"day{day:02d}"
+
+def input_path(day: int) -> str:
+    return f"assets/{module_name(day)}/in.txt"
+
+def load_module(day: int):
+    return importlib.import_module(module_name(day))
+
+def load_input(day: int, filename: str | None = None):
+    return PUZZLES[day].read(load_module(day), filename or input_path(day))
+
+def answer(day: int, part: int):
+    return load_module(day).ANSWERS[part - 1]
+
+def clear_caches(day: int):
+    ''' Module level functools caches would carry work over from a previous solve '''
+    for value in vars(load_module(day)).values():
+        if hasattr(value, "cache_clear"):
+            value.cache_clear()
+
+def solve(day: int, part: int, input, **params):
+    ''' `params` override a part's puzzle-size arguments, e.g. the grid size of a generated input '''
+    return PUZZLES[day].parts[part - 1].solve(load_module(day), input, **params)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+
+import cache
+import puzzles
+
+TIMINGS = os.path.join(".cache", "timings.json")
+
+Result = collections.namedtuple(
+    "Result", ["day", "part", "answer", "elapsed", "cached"], defaults = [False]
+)
+
+def check_answer(day: int, part: int, answer):
+    expected = puzzles.answer(day, part)
+    assert answer == expected, f"Day {day:02d} part {part}: {answer} != {expected}"
+
+def run_part(day: int, part: int, input, profile: bool = False) -> Result:
+    start = time.perf_counter()
+    if profile:
+        import profiling
+
+        answer = profiling.profile(
+            f"{puzzles.module_name(day)}-part{part}", lambda: puzzles.solve(day, part, input)
+        )
+    else:
+        answer = puzzles.solve(day, part, input)
+    elapsed = time.perf_counter() - start
+
+    check_answer(day, part, answer)
+
+    return Result(day, part, answer, elapsed)
+
+def answer_key(answers: cache.AnswerCache, day: int, part: int) -> str:
+    return answers.key(day, part, puzzles.load_module(day), puzzles.input_path(day), puzzles)
+
+def cached_result(answers: cache.AnswerCache | None, day: int, part: int) -> Result | None:
+    if answers is None or (answer := answers.get(answer_key(answers, day, part))) is None:
+        return None
+
+    check_answer(day, part, answer)
+
+    return Result(day, part, answer, 0.0, cached = True)
+
+def run_day(day: int, profile: bool = False, answers: cache.AnswerCache | None = None) -> list[Result]:
+    ''' The input is only read once some part is missing from `answers` '''
+    results = []
+    input = None
+
+    for part in range(1, len(puzzles.PUZZLES[day].parts) + 1):
+        if (result := cached_result(answers, day, part)) is not None:
+            results.append(result)
+            continue
+
+        if input is None:
+            start = time.perf_counter()
+            input = puzzles.load_input(day)
+            results.append(Result(day, 0, None, time.perf_counter() - start))
+
+        results.append(run_part(day, part, input, profile))
+        if answers is not None:
+            answers.put(answer_key(answers, day, part), results[-1].answer)
+
+    return results
+
+def run_task(day: int, part: int) -> Result:
+    ''' One part in a worker process, reading the input itself '''
+    return run_part(day, part, puzzles.load_input(day))
+
+def timing_key(day: int, part: int) -> str:
+    return f"{day:02d}.{part}"
+
+def load_timings() -> dict[str, float]:
+    if not os.path.exists(TIMINGS):
+        return {}
+
+    with open(TIMINGS, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def save_timings(results: list[Result]):
+    timings = load_timings()
+    timings.update({
+        timing_key(result.day, result.part): result.elapsed
+        for result in results
+        if result.part and not result.cached
+    })
+
+    os.makedirs(os.path.dirname(TIMINGS), exist_ok = True)
+    with open(TIMINGS, "w", encoding="utf-8") as file:
+        json.dump(timings, file, indent = 2, sort_keys = True)
+
+def run_parallel(days: list[int], jobs: int, answers: cache.AnswerCache | None = None) -> tuple[list[Result], list[str]]:
+    ''' Longest job first by the previous run's timings, unknown parts go first
+
+        Cached answers are looked up and stored in this process, workers only
+        solve the misses.
+    '''
+    results, failures, tasks = [], [], []
+    for day in days:
+        for part in range(1, len(puzzles.PUZZLES[day].parts) + 1):
+            if (result := cached_result(answers, day, part)) is not None:
+                results.append(result)
+                report(result)
+            else:
+                tasks.append((day, part))
+
+    # A single day is the common case, the pool machinery is only imported when used
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    timings = load_timings()
+    tasks.sort(key = lambda task: -timings.get(timing_key(*task), float("inf")))
+
+    with ProcessPoolExecutor(max_workers = jobs) as executor:
+        futures = {executor.submit(run_task, *task): task for task in tasks}
+
+        for future in as_completed(futures):
+            day, part = futures[future]
+            try:
+                result = future.result()
+            except Exception as error:
+                failures.append(f"Day {day:02d} Part {part}: {error!r}")
+                print(f"Day {day:02d} Part {part} FAILED {error!r}", flush = True)
+            else:
+                results.append(result)
+                report(result)
+                if answers is not None:
+                    answers.put(answer_key(answers, day, part), result.answer)
+
+    return results, failures
+
+def report(result: Result):
+    name = f"Part {result.part}" if result.part else "Read"
+    answer = "" if result.answer is None else result.answer
+    cached = " (cached)" if result.cached else ""
+    print(f"Day {result.day:02d} {name:<6} {result.elapsed * 1000:>10.1f} ms  {answer}{cached}", flush = True)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = "Run Advent of Code 2024 days in one process")
+    parser.add_argument("days", nargs = "*", type = int, default = sorted(puzzles.PUZZLES))
+    parser.add_argument("--check", action = "store_true", help = "run each day's check() on the small inputs first")
+    parser.add_argument(
+        "-j", "--jobs", type = int, nargs = "?", const = os.cpu_count(), default = 0,
+        help = "solve parts in a process pool of this size (all CPUs if no value)"
+    )
+    parser.add_argument(
+        "--profile", action = "store_true",
+        help = "run every part under cProfile and tracemalloc, dumping reports to .cache/profiles"
+    )
+    parser.add_argument(
+        "--no-cache", action = "store_true",
+        help = f"solve every part even when {cache.ANSWERS} has its answer, refreshing the entry"
+    )
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    if args.check:
+        for day in args.days:
+            puzzles.load_module(day).check()
+
+    if args.jobs and args.profile:
+        sys.exit("--profile runs parts in this process, it can't be combined with --jobs")
+
+    # Profiling wants every part to actually run, so it never reads the cache
+    answers = cache.AnswerCache()
+    lookup = None if args.no_cache or args.profile else answers
+
+    start = time.perf_counter()
+    if args.jobs:
+        results, failures = run_parallel(args.days, args.jobs, lookup)
+    else:
+        results, failures = [], []
+        for day in args.days:
+            for result in run_day(day, args.profile, lookup):
+                report(result)
+                results.append(result)
+    wall = time.perf_counter() - start
+
+    if lookup is None:
+        for result in results:
+            if result.part:
+                answers.put(answer_key(answers, result.day, result.part), result.answer)
+    answers.save()
+
+    if not args.profile:
+        save_timings(results)
+
+    print(f"Total {sum(result.elapsed for result in results) * 1000:>15.1f} ms")
+    if args.jobs:
+        print(f"Wall  {wall * 1000:>15.1f} ms")
+
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
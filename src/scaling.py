@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+''' Empirical growth of every solver on generated inputs of geometrically increasing size
+
+    The fitted exponent `k` is the slope of log(time) or log(peak memory) against
+    log(input bytes), so `k ~ 1` is linear and `k ~ 2` quadratic whatever the
+    day's own notion of size is.
+
+    Every point is the fastest of a few runs, sizes only count once a run takes
+    longer than a floor (below it the interpreter's constant overhead dominates)
+    and a size whose input barely grew is skipped, as the slope of such a point is
+    all noise.
+'''
+
+import argparse
+import collections
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+import generate
+import puzzles
+
+Scaling = collections.namedtuple(
+    "Scaling", ["size", "ratio", "parts"], defaults = [2, None]
+)
+
+GRID = 2 ** 0.5
+
+# Consecutive points need this much more input, and all of them together this
+# span, for a slope to be fitted
+MIN_GROWTH = 1.25
+MIN_SPAN = 4
+
+# Sizes grown past the requested steps while looking for measurable ones
+MAX_EXTRA_STEPS = 16
+
+# Base sizes, growth ratio of the size (grid days grow the side by sqrt(2) so the
+# input doubles) and the parts that stay meaningful on generated inputs
+SCALING = {
+    1: Scaling(1_000),
+    2: Scaling(1_000),
+    3: Scaling(1_000),
+    4: Scaling(40, GRID),
+    5: Scaling(200),
+    6: Scaling(30, GRID),
+    7: Scaling(100),
+    8: Scaling(40, GRID),
+    9: Scaling(2_001),
+    10: Scaling(40, GRID),
+    11: Scaling(4),
+    12: Scaling(30, GRID),
+    13: Scaling(200),
+    14: Scaling(250, parts = [1]),
+    15: Scaling(15, GRID),
+    16: Scaling(31, GRID),
+    17: Scaling(4, parts = [1]),
+    18: Scaling(21, GRID),
+    19: Scaling(50),
+    20: Scaling(21, GRID),
+    21: Scaling(5),
+    22: Scaling(100),
+    23: Scaling(100),
+    24: Scaling(20, parts = [1]),
+    25: Scaling(100),
+}
+
+Measurement = collections.namedtuple(
+    "Measurement", ["size", "bytes", "elapsed", "peak"]
+)
+
+def measure(day: int, part: int, size: int, repeats: int, memory: bool) -> Measurement:
+    ''' `elapsed` is the fastest of `repeats` runs, the others only add noise '''
+    filename, params = generate.write(day, size)
+    input = puzzles.load_input(day, filename)
+
+    elapsed = float("inf")
+    for _ in range(repeats):
+        puzzles.clear_caches(day)
+        start = time.perf_counter()
+        puzzles.solve(day, part, input, **params)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        puzzles.clear_caches(day)
+        tracemalloc.start()
+        puzzles.solve(day, part, input, **params)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return Measurement(size, os.path.getsize(filename), elapsed, peak)
+
+def fit_exponent(xs: list[float], ys: list[float]) -> float:
+    ''' Least squares slope of log(y) against log(x) '''
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        return float("nan")
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return float("nan")
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+def scale(day: int, part: int, steps: int, repeats: int, floor: float, budget: float, memory: bool) -> list[Measurement]:
+    ''' Sizes grow until `steps` points are measured or one run takes longer than `budget` seconds
+
+        Runs faster than `floor` seconds, or on an input less than `MIN_GROWTH`
+        times the previous point's, aren't kept.
+    '''
+    scaling = SCALING[day]
+
+    measurements = []
+    for step in range(steps + MAX_EXTRA_STEPS):
+        size = round(scaling.size * scaling.ratio ** step)
+        measurement = measure(day, part, size, repeats, memory)
+
+        if measurement.elapsed > budget:
+            if not measurements:
+                measurements.append(measurement)
+            break
+
+        if measurement.elapsed < floor:
+            continue
+        if measurements and measurement.bytes < measurements[-1].bytes * MIN_GROWTH:
+            continue
+
+        measurements.append(measurement)
+        if len(measurements) == steps:
+            break
+
+    return measurements
+
+def fit(measurements: list[Measurement], values: list[float]) -> float:
+    ''' Exponent of `values` against the input bytes, nan when the inputs span too little '''
+    sizes = [measurement.bytes for measurement in measurements]
+    if sizes[-1] < sizes[0] * MIN_SPAN:
+        return float("nan")
+
+    return fit_exponent(sizes, values)
+
+def describe(exponent: float) -> str:
+    if math.isnan(exponent):
+        return "?"
+
+    return f"n^{round(exponent * 2) / 2:g}"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = "Fit time and memory growth exponents of every solver")
+    parser.add_argument("days", nargs = "*", type = int, default = sorted(SCALING))
+    parser.add_argument("--steps", type = int, default = 5, help = "measured input sizes per part, each at least MIN_GROWTH times the previous")
+    parser.add_argument("--repeats", type = int, default = 3, help = "runs per size, the fastest is kept")
+    parser.add_argument("--floor", type = float, default = 0.01, help = "grow the size until a run takes at least this many seconds")
+    parser.add_argument("--budget", type = float, default = 5.0, help = "stop growing a part once a run takes this many seconds")
+    parser.add_argument("--no-memory", action = "store_true", help = "skip the tracemalloc runs")
+    parser.add_argument("--max-exponent", type = float, help = "fail when a time exponent exceeds this")
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    # Day 17's register only takes long enough to time well past the 4300 digits
+    # Python converts by default
+    sys.set_int_max_str_digits(0)
+
+    too_steep = []
+    for day in args.days:
+        parts = SCALING[day].parts or range(1, len(puzzles.PUZZLES[day].parts) + 1)
+
+        for part in parts:
+            measurements = scale(
+                day, part, args.steps, args.repeats, args.floor, args.budget, not args.no_memory
+            )
+            sizes = [measurement.bytes for measurement in measurements]
+
+            time_exponent = fit(measurements, [measurement.elapsed for measurement in measurements])
+            line = f"Day {day:02d} Part {part}: time {time_exponent:5.2f} ({describe(time_exponent)})"
+
+            if not args.no_memory:
+                memory_exponent = fit(measurements, [measurement.peak for measurement in measurements])
+                line += f", memory {memory_exponent:5.2f} ({describe(memory_exponent)})"
+
+            line += f"  over {sizes[0]}..{sizes[-1]} bytes, {measurements[-1].elapsed * 1000:.1f} ms at the largest"
+            print(line, flush = True)
+
+            if args.max_exponent is not None and time_exponent > args.max_exponent:
+                too_steep.append(f"Day {day:02d} Part {part}")
+
+    if too_steep:
+        print(f"Growth above n^{args.max_exponent:g}: {', '.join(too_steep)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+''' Import time of every day module and cold start of a single day, each measured
+    in a fresh interpreter
+
+    `import` is the day module's cumulative `-X importtime` figure, `heaviest` the
+    imports with the largest own time underneath it. `script` is the wall time of
+    `python3 src/dayNN.py` and `run` the one of `python3 src/run.py NN`, which
+    answers from the cache once the day has been solved.
+'''
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import puzzles
+
+SRC = os.path.dirname(os.path.abspath(__file__))
+
+def imports(code: str) -> list[tuple[int, int, str]]:
+    ''' (own, cumulative, name) in microseconds of every import `code` triggers,
+        nested imports have `name` indented
+    '''
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd = SRC, capture_output = True, text = True, check = True
+    )
+
+    found = []
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            own, cumulative, name = line.removeprefix("import time:").split("|")
+            found.append((int(own), int(cumulative), name[1:]))
+
+    return found
+
+def import_time(module: str, startup: set[str]) -> tuple[float, list[tuple[float, str]]]:
+    ''' Cumulative import time of `module` and the own time of everything it imported
+        apart from the interpreter's `startup` modules, in seconds
+    '''
+    cumulative, imported = 0.0, []
+    for own, total, name in imports(f"import {module}"):
+        if name == module:
+            cumulative = total / 1e6
+        elif name.strip() not in startup:
+            imported.append((own / 1e6, name.strip()))
+
+    return cumulative, imported
+
+def wall_time(command: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, stdout = subprocess.DEVNULL, check = True)
+
+    return time.perf_counter() - start
+
+def median(runs: int, measure) -> float:
+    return statistics.median(measure() for _ in range(runs))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = "Report import and cold start times of the day modules")
+    parser.add_argument("days", nargs = "*", type = int, default = sorted(puzzles.PUZZLES))
+    parser.add_argument("--runs", type = int, default = 5, help = "fresh interpreters per measurement, the median is reported")
+    parser.add_argument("--top", type = int, default = 3, help = "heaviest imports listed per day")
+    parser.add_argument("--cold", action = "store_true", help = "also time the day's script and run.py from a fresh interpreter")
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    interpreter = median(args.runs, lambda: wall_time([sys.executable, "-c", "pass"]))
+    startup = {name.strip() for _, _, name in imports("pass")}
+    print(f"Interpreter {interpreter * 1000:>8.1f} ms")
+
+    for day in args.days:
+        module = puzzles.module_name(day)
+
+        samples = [import_time(module, startup) for _ in range(args.runs)]
+        cumulative = statistics.median(sample[0] for sample in samples)
+        heaviest = sorted(samples[0][1], reverse = True)[:args.top]
+
+        line = f"Day {day:02d} import {cumulative * 1000:>7.1f} ms"
+        if args.cold:
+            script = median(args.runs, lambda: wall_time([sys.executable, os.path.join(SRC, f"{module}.py")]))
+            run = median(args.runs, lambda: wall_time([sys.executable, os.path.join(SRC, "run.py"), str(day)]))
+            line += f"  script {script * 1000:>9.1f} ms  run {run * 1000:>7.1f} ms"
+        line += "  heaviest " + ", ".join(f"{name} {own * 1000:.1f}" for own, name in heaviest)
+
+        print(line, flush = True)
+
+if __name__ == "__main__":
+    main()